@@ -0,0 +1,90 @@
+"""
+Memory held by a large decoded order history, with and without symbol/string sharing
+
+    python benchmarks/order_memory.py [orders] [symbols]
+"""
+
+import json
+import sys
+import tracemalloc
+
+from qcapi._backtests._orders import BacktestOrdersResponse
+from qcapi.models._registry import _FINALIZERS, decode_json
+
+
+def make_page(start: int, count: int, symbols: int) -> bytes:
+    orders = []
+    for i in range(start, start + count):
+        ticker = f"TICKER{i % symbols}"
+        symbol_id = f"{ticker} R735QTJ8XC9X"
+        orders.append(
+            {
+                "id": i,
+                "brokerId": [str(i)],
+                "symbol": {"value": ticker, "id": symbol_id, "permtick": ticker},
+                "price": 100.0,
+                "priceCurrency": "USD",
+                "time": "2023-01-03T14:31:00Z",
+                "createdTime": "2023-01-03T14:31:00Z",
+                "lastFillTime": "2023-01-03T14:31:00Z",
+                "quantity": 10.0,
+                "type": 0,
+                "status": 3,
+                "securityType": 1,
+                "direction": 0,
+                "value": 1000.0,
+                "orderSubmissionData": {"bidPrice": 99.9, "askPrice": 100.1, "lastPrice": 100.0},
+                "isMarketable": True,
+                "properties": {"timeInForce": {}},
+                "events": [
+                    {
+                        "algorithmId": "backtest-8a1b2c3d4e5f",
+                        "symbol": symbol_id,
+                        "symbolValue": ticker,
+                        "symbolPermtick": ticker,
+                        "orderId": i,
+                        "orderEventId": 1,
+                        "id": f"{i}-1",
+                        "status": "filled",
+                        "orderFeeAmount": 1.0,
+                        "orderFeeCurrency": "USD",
+                        "fillPrice": 100.0,
+                        "fillPriceCurrency": "USD",
+                        "fillQuantity": 10.0,
+                        "direction": "buy",
+                        "message": "",
+                        "isAssignment": False,
+                        "quantity": 10.0,
+                        "time": 1672756260.0,
+                    }
+                ],
+            }
+        )
+    return json.dumps({"orders": orders, "length": count, "success": True}).encode()
+
+
+def measure(pages: list[bytes]) -> int:
+    tracemalloc.start()
+    responses = [decode_json(BacktestOrdersResponse, page) for page in pages]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert all(response is not None for response in responses)
+    return current
+
+
+def main(orders: int = 50_000, symbols: int = 50) -> None:
+    # read_all fetches pages of 100 orders
+    pages = [make_page(start, min(100, orders - start), symbols) for start in range(0, orders, 100)]
+    finalizer = _FINALIZERS.pop(BacktestOrdersResponse)
+    try:
+        plain = measure(pages)
+    finally:
+        _FINALIZERS[BacktestOrdersResponse] = finalizer
+    shared = measure(pages)
+    print(f"{orders} orders, {symbols} symbols")
+    print(f"  plain:  {plain / 2**20:8.1f} MiB")
+    print(f"  shared: {shared / 2**20:8.1f} MiB ({1 - shared / plain:.0%} less)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -28,13 +28,10 @@ def run_backtest(project_id: str | int, output_dir: Path, test_name: str, parame
 
     # iterate params?
     response = client.backtests.create(project_id, response.compileId, test_name, parameters=parameters)
-    completed = False
     print(f"Status: {response.backtest.status}")
-    while not completed:
-        status = client.backtests.read(project_id, response.backtest.backtest_id)
-        completed = status.backtest.completed
-        print(f"Status: {status.backtest.status}")
-        time.sleep(5)
+    backtest_id = response.backtest.backtest_id
+    status = client.backtests.wait_all(project_id, [backtest_id])[backtest_id]
+    print(f"Status: {status.backtest.status}")
 
     with open(output_dir / f"{test_name}.json", "w") as f:
         f.write(status.model_dump_json(indent=3))
@@ -43,14 +40,15 @@ def run_backtest(project_id: str | int, output_dir: Path, test_name: str, parame
         client.backtests.delete(project_id, response.backtest.backtest_id)
 
 
-def draw_chart(project_id, backtest_id, chart_name, series_name):
+def draw_chart(project_id, backtest_id, chart_name, series_name, max_points: int | None = 2_000):
     client = get_client()
     # note: the count needs to be quite large due to equity having multiple per points per day
     resp = client.backtests.chart.read(project_id, backtest_id, chart_name, 50_000)
     if resp.chart is None:
         raise RuntimeError("Missing chart daa")
+    chart = resp.chart if max_points is None else resp.chart.downsample(max_points)
     traces = []
-    for name, series in resp.chart.series.items():
+    for name, series in chart.series.items():
         print(name)
         print(len(series.values))
         if series.seriesType == ChartSeriesTypeEnum.Line:
@@ -1,3 +1,34 @@
-from ._client import QCClient
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["QCClient"]
+if TYPE_CHECKING:
+    from ._backtests._chart import ChartStore
+    from ._backtests._sweep import PruneRule, RunLedger
+    from ._client import QCClient
+    from ._pool import QCClientPool
+    from ._quarantine import Quarantine
+
+# loaded lazily so that `import qcapi` does not pull in requests/pydantic up front
+_LAZY = {
+    "ChartStore": "._backtests._chart",
+    "PruneRule": "._backtests._sweep",
+    "QCClient": "._client",
+    "QCClientPool": "._pool",
+    "Quarantine": "._quarantine",
+    "RunLedger": "._backtests._sweep",
+}
+
+__all__ = ["ChartStore", "PruneRule", "QCClient", "QCClientPool", "Quarantine", "RunLedger"]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
@@ -1,10 +1,28 @@
-from typing import TYPE_CHECKING, Any
+import json
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List
 from ..models import BacktestSummaryResponse, BacktestResponse
+from .._concurrency import map_concurrent
+from .._streaming import iter_sections
+from ..errors import QCException
 from ._orders import OrdersEndpoint
 from ._chart import ChartEndpoint
+from ._optimization import OptimizationResults
+from ._sweep import PruneRuleFn, RunLedger, SweepMonitor, parameter_key, sweep_backtest_name
+from ._wait import ProgressTracker, is_finished, summary_progress
 
 if TYPE_CHECKING:
     from .._client import QCClient
+    from ..models import Chart
+
+# containers read_stream walks into, everything below them is yielded as its own section
+_STREAM_DESCEND = {
+    (),
+    ("backtest",),
+    ("backtest", "rollingWindow"),
+    ("backtest", "totalPerformance"),
+    ("backtest", "totalPerformance", "closedTrades"),
+}
 
 
 class Backtests:
@@ -22,6 +40,46 @@ class Backtests:
             response_type=BacktestSummaryResponse,
         )
 
+    def list_optimization(self, project_id, optimization_id: str, include_statistics=True):
+        """Summaries of the project's backtests that belong to `optimization_id`"""
+        backtests = self.list(project_id, include_statistics=include_statistics).backtests
+        return [bt for bt in backtests if bt.optimizationId == optimization_id]
+
+    def read_optimization(
+        self,
+        project_id,
+        optimization_id: str,
+        *,
+        charts: Iterable[str] = (),
+        chart_count: int = 50_000,
+        max_workers: int = 8,
+    ) -> OptimizationResults:
+        """
+        Read the full result (and optionally charts) of every backtest of an optimization
+
+        Reads run concurrently on `max_workers` threads, failures are collected per
+        backtest in `errors` instead of aborting the batch.
+        """
+        results = OptimizationResults(optimization_id, self.list_optimization(project_id, optimization_id))
+        chart_names = list(charts)
+
+        def fetch(backtest_id):
+            backtest = self.read(project_id, backtest_id).backtest
+            fetched = {}
+            for name in chart_names:
+                chart = self.chart.read(project_id, backtest_id, name, chart_count).chart
+                if chart is not None:
+                    fetched[name] = chart
+            return backtest, fetched
+
+        ids = [summary.backtestId for summary in results.summaries]
+        for backtest_id, result, error in map_concurrent(fetch, ids, max_workers):
+            if error is not None:
+                results.errors[backtest_id] = error
+            else:
+                results.backtests[backtest_id], results.charts[backtest_id] = result
+        return results
+
     def create(self, project_id: str | int, compile_id: str, backtest_name, parameters: dict | None):
         ...
         # parameters syntax in to json is a bit odd:
@@ -36,6 +94,83 @@ class Backtests:
             response_type=BacktestResponse,
         )
 
+    def reusable_runs(self, project_id, signature: str, ledger: RunLedger) -> dict[str, str]:
+        """
+        parameter key -> backtest id of the ledger's runs of `signature` that can be reused
+
+        Completed and still running backtests are reused. Runs that errored, were deleted
+        or report other parameters are dropped from the ledger so that they run again.
+        """
+        recorded = ledger.runs(signature)
+        if not recorded:
+            return {}
+        summaries = {bt.backtestId: bt for bt in self.list(project_id, include_statistics=False).backtests}
+        reusable = {}
+        for key, backtest_id in recorded.items():
+            summary = summaries.get(backtest_id)
+            # queued backtests may not report their parameterSet yet
+            if (
+                summary is None
+                or "Error" in summary.status
+                or (summary.parameterSet and parameter_key(summary.parameterSet) != key)
+            ):
+                ledger.forget(signature, json.loads(key))
+            else:
+                reusable[key] = backtest_id
+        return reusable
+
+    def create_missing(
+        self,
+        project_id,
+        compile_id: str,
+        parameter_sets: Iterable[dict],
+        *,
+        signature: str,
+        ledger: RunLedger,
+        backtest_name: str | None = None,
+    ) -> List[str]:
+        """
+        Backtest ids for each of `parameter_sets`, only launching points without a reusable run
+
+        signature: `signature` of the compile response, identifies the compiled code
+        ledger: where launched runs are recorded, see `RunLedger`
+        backtest_name: format string for the name of launched backtests, e.g. "fast={ema_fast}",
+            defaults to listing the parameters
+        """
+        reusable = self.reusable_runs(project_id, signature, ledger)
+        backtest_ids = []
+        for parameters in parameter_sets:
+            key = parameter_key(parameters)
+            backtest_id = reusable.get(key)
+            if backtest_id is None:
+                name = sweep_backtest_name(parameters, backtest_name)
+                backtest_id = self.create(project_id, compile_id, name, parameters).backtest.backtest_id
+                ledger.record(signature, parameters, backtest_id)
+                reusable[key] = backtest_id
+            backtest_ids.append(backtest_id)
+        return backtest_ids
+
+    def create_or_reuse(
+        self, project_id, compile_id: str, backtest_name, parameters: dict, *, signature: str, ledger: RunLedger
+    ) -> str:
+        """`create`, unless the ledger has a reusable run of the same code and parameters, returns its id"""
+        backtest_id = self.reusable_runs(project_id, signature, ledger).get(parameter_key(parameters))
+        if backtest_id is None:
+            backtest_id = self.create(project_id, compile_id, backtest_name, parameters).backtest.backtest_id
+            ledger.record(signature, parameters, backtest_id)
+        return backtest_id
+
+    def sweep(
+        self, project_id, compile_id: str, parameter_sets: Iterable[dict], rules: Iterable[PruneRuleFn] = (), **options
+    ) -> SweepMonitor:
+        """
+        Sweep monitor over `parameter_sets`, call `run()` on it to launch and wait for the runs
+
+        rules: prune rules such as `PruneRule("drawdown", above=0.25, after=0.3)`
+        options: see `SweepMonitor` (max_concurrent, ledger/signature, backtest_name, delete)
+        """
+        return SweepMonitor(self, project_id, compile_id, parameter_sets, rules, **options)
+
     def read(self, project_id: str | int, backtest_id: str, chart: str | None = None):
         if chart is not None:
             params = dict(projectId=project_id, backtestId=backtest_id, chart=chart)
@@ -48,6 +183,110 @@ class Backtests:
             response_type=BacktestResponse,
         )
 
+    def read_many(
+        self, project_id, backtest_ids: Iterable[str], *, max_workers: int = 8, ordered: bool = False
+    ) -> Iterator[tuple[str, BacktestResponse | None, Exception | None]]:
+        """
+        Read many backtests concurrently, yielding `(backtest_id, response, error)` per backtest
+
+        A failed read is reported in `error` without stopping the others. Results come
+        as they complete, or in the order of `backtest_ids` with `ordered`.
+        """
+        return map_concurrent(lambda bt_id: self.read(project_id, bt_id), backtest_ids, max_workers, ordered)
+
+    def read_all_charts(
+        self, project_id, backtest_id: str, count: int = 50_000, *, max_workers: int = 4, timeout: float = 120.0
+    ) -> tuple[dict[str, "Chart"], dict[str, Exception]]:
+        """Read every chart listed in the backtest result concurrently, returns (name -> Chart, name -> error)"""
+        names = list(self.read(project_id, backtest_id).backtest.charts)
+        return self.chart.read_all(project_id, backtest_id, names, count, max_workers=max_workers, timeout=timeout)
+
+    def wait_all(
+        self,
+        project_id,
+        backtest_ids: Iterable[str],
+        *,
+        timeout: float | None = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        max_workers: int = 8,
+        on_complete: Callable[[BacktestResponse], None] | None = None,
+    ) -> dict[str, BacktestResponse]:
+        """
+        Wait for many backtests with one `list` call (without statistics) per tick
+
+        The full result of each backtest is only read once it has finished. The polling
+        interval adapts to the observed progress rate, see `ProgressTracker`.
+
+        on_complete: called with each full result as soon as it has been read
+        """
+        pending = set(backtest_ids)
+        results: dict[str, BacktestResponse] = {}
+        tracker = ProgressTracker(min_interval, max_interval)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while pending:
+            summaries = {
+                bt.backtestId: bt
+                for bt in self.list(project_id, include_statistics=False).backtests
+                if bt.backtestId in pending
+            }
+            missing = pending - summaries.keys()
+            if missing:
+                raise QCException(f"Backtests not found in project {project_id}: {sorted(missing)}")
+            progress = {bt_id: summary_progress(bt.progress) for bt_id, bt in summaries.items()}
+            finished = [bt_id for bt_id, bt in summaries.items() if is_finished(bt.status)]
+            for backtest_id, response, error in self.read_many(project_id, finished, max_workers=max_workers):
+                if error is not None:
+                    raise error
+                results[backtest_id] = response
+                pending.discard(backtest_id)
+                tracker.forget(backtest_id)
+                if on_complete is not None:
+                    on_complete(response)
+            if not pending:
+                break
+            interval = tracker.update({bt_id: progress[bt_id] for bt_id in pending})
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Backtests still running: {sorted(pending)}")
+                interval = min(interval, remaining)
+            time.sleep(interval)
+        return results
+
+    def read_stream(
+        self, project_id: str | int, backtest_id: str, skip: Iterable[tuple] = ()
+    ) -> Iterator[tuple[tuple, Any]]:
+        """
+        Read a backtest incrementally, yielding `(path, value)` sections as they arrive
+
+        Each entry of `backtest.rollingWindow` and of `backtest.totalPerformance.closedTrades`
+        is its own section, the other fields of `backtest` and `totalPerformance`
+        (`statistics`, `tradeStatistics`, ...) are yielded whole. Values are plain JSON,
+        callers can validate, aggregate or spill them to disk one at a time.
+
+        skip: path prefixes such as `("backtest", "rollingWindow")` that are scanned
+            without being buffered or decoded
+        """
+        skip_prefixes = [tuple(prefix) for prefix in skip]
+
+        def skipped(path):
+            return any(path[: len(prefix)] == prefix for prefix in skip_prefixes)
+
+        params = dict(projectId=project_id, backtestId=backtest_id)
+        chunks = self._client.stream("GET", f"{self._url}/read", json=params)
+        success = True
+        errors = None
+        for path, value in iter_sections(chunks, lambda path: path in _STREAM_DESCEND, skipped):
+            if path == ("success",):
+                success = value
+            elif path == ("errors",):
+                errors = value
+            yield path, value
+        if not success:
+            error_str = errors[0] if errors else "Unknown error"
+            raise QCException(f"QC error for {self._url}/read\n\t{error_str}", errors=errors)
+
     def delete(self, project_id: str | int, backtest_id: str):
         return self._client.request(
             "DELETE",
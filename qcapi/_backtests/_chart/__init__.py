@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING 
-from pydantic import BaseModel
-
-from ...models import Chart 
+import time
+from typing import TYPE_CHECKING, Iterable
+from ...models import Chart
+from ..._concurrency import map_concurrent
+from ...models._base import QCModel
+from ._follower import ChartFollower, SeriesTail
+from ._store import ChartStore, StoredChart, StoredSeries
 
 if TYPE_CHECKING:
     from ..._client import QCClient
@@ -30,11 +33,80 @@ class ChartEndpoint:
             params["end"] = end
         return self._client.request("GET", f"{self._url}/read", json=params, response_type=ReadChartResponse)
 
+    def read_complete(
+        self,
+        project_id,
+        backtest_id,
+        name: str,
+        count: int = 50_000,
+        *,
+        timeout: float = 120.0,
+        poll_interval: float = 2.0,
+    ) -> Chart:
+        """Read a chart, re-requesting it while QC is still generating it (no chart, progress below 100)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            response = self.read(project_id, backtest_id, name, count)
+            if response.chart is not None:
+                return response.chart
+            if response.progress is None or response.progress >= 100:
+                raise RuntimeError(f"Chart {name} is not available for backtest {backtest_id}")
+            if time.monotonic() + poll_interval > deadline:
+                raise TimeoutError(f"Chart {name} still generating ({response.progress}%) for backtest {backtest_id}")
+            time.sleep(poll_interval)
+
+    def read_all(
+        self,
+        project_id,
+        backtest_id,
+        names: Iterable[str],
+        count: int = 50_000,
+        *,
+        max_workers: int = 4,
+        timeout: float = 120.0,
+    ) -> tuple[dict[str, Chart], dict[str, Exception]]:
+        """
+        Read several charts of a backtest concurrently
+
+        At most `max_workers` requests are in flight. A chart that fails to read does
+        not stop the others, returns (name -> Chart in the order of `names`, name -> error).
+        """
+        charts: dict[str, Chart] = {}
+        errors: dict[str, Exception] = {}
+        for name, chart, error in map_concurrent(
+            lambda name: self.read_complete(project_id, backtest_id, name, count, timeout=timeout),
+            names,
+            max_workers,
+            ordered=True,
+        ):
+            if error is not None:
+                errors[name] = error
+            else:
+                charts[name] = chart
+        return charts, errors
+
+    def follow(self, project_id, backtest_id, name: str, count: int = 50_000) -> ChartFollower:
+        """
+        Create a follower that incrementally tails a chart of an in-progress backtest
+
+        count: the number of data points to request per poll
+        """
+        return ChartFollower(self, project_id, backtest_id, name, count)
+
 
-class ReadChartResponse(BaseModel):
+class ReadChartResponse(QCModel):
     chart: "Chart | None" = None
     progress: int | None = None
     success: bool
     errors: list[str] | None = None
 
 
+__all__ = [
+    "ChartEndpoint",
+    "ChartFollower",
+    "ChartStore",
+    "ReadChartResponse",
+    "SeriesTail",
+    "StoredChart",
+    "StoredSeries",
+]
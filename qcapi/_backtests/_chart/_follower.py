@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import time
+from array import array
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from ...models._chart import point_values
+
+if TYPE_CHECKING:
+    from . import ChartEndpoint
+    from ...models import ChartSeries, ChartSeriesTypeEnum
+
+
+class SeriesTail:
+    """Append-only columnar copy of a single chart series"""
+
+    def __init__(self, name: str, series_type: "ChartSeriesTypeEnum", unit: str, column_names: tuple[str, ...]):
+        self.name = name
+        self.seriesType = series_type
+        self.unit = unit
+        self.columns: dict[str, array] = {column: array("d") for column in column_names}
+        self._width = len(column_names)
+        self._time = self.columns[column_names[0]]
+
+    def __len__(self) -> int:
+        return len(self._time)
+
+    @property
+    def last_time(self) -> float | None:
+        """Timestamp (UTC seconds) of the newest point held, None if empty"""
+        return self._time[-1] if self._time else None
+
+    def extend(self, series: "ChartSeries") -> int:
+        """Append the points of `series` newer than `last_time`, returns how many were added"""
+        last_time = self.last_time
+        columns = list(self.columns.values())
+        added = 0
+        for point in series.values:
+            values = point_values(point, self._width)
+            if last_time is not None and values[0] <= last_time:
+                continue
+            for column, value in zip(columns, values):
+                column.append(value)
+            last_time = values[0]
+            added += 1
+        return added
+
+
+class ChartFollower:
+    """
+    Keeps an in-memory tail of a chart, each `poll` only requests points newer than
+    the last timestamp seen for every series
+    """
+
+    def __init__(self, endpoint: "ChartEndpoint", project_id, backtest_id: str, name: str, count: int = 50_000):
+        self._endpoint = endpoint
+        self.project_id = project_id
+        self.backtest_id = backtest_id
+        self.name = name
+        self.count = count
+        self.series: dict[str, SeriesTail] = {}
+        self.progress: int | None = None
+
+    @property
+    def start(self) -> int | None:
+        """
+        Start timestamp for the next request, the oldest of the per-series last timestamps
+
+        Series without points yet are ignored, otherwise one empty series would make every
+        poll download the whole chart. `SeriesTail.extend` drops the points already held.
+        """
+        last_times = [tail.last_time for tail in self.series.values() if tail.last_time is not None]
+        if not last_times:
+            return None
+        return int(min(last_times))
+
+    def poll(self) -> dict[str, int]:
+        """Fetch new points and append them, returns the number of points added per series"""
+        response = self._endpoint.read(self.project_id, self.backtest_id, self.name, self.count, start=self.start)
+        self.progress = response.progress
+        if response.chart is None:
+            return {}
+        added = {}
+        for series_name, series in response.chart.series.items():
+            tail = self.series.get(series_name)
+            if tail is None:
+                tail = SeriesTail(series.name, series.seriesType, series.unit, series.column_names())
+                self.series[series_name] = tail
+            added[series_name] = tail.extend(series)
+        return added
+
+    def follow(self, interval: float = 5.0, stop: Callable[[], bool] | None = None) -> Iterator[dict[str, int]]:
+        """
+        Poll every `interval` seconds, yielding the per-series added counts after each poll
+
+        stop: checked after every poll, iteration ends once it returns True
+        """
+        while True:
+            yield self.poll()
+            if stop is not None and stop():
+                return
+            time.sleep(interval)
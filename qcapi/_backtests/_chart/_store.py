@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import uuid
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from ...models._chart import _DICT_KEYS, Chart, ChartSeries, ChartSeriesTypeEnum, ChartTypeEnum
+
+if TYPE_CHECKING:
+    from ..._client import QCClient
+
+_META = "meta.json"
+_ITEM_SIZE = array("d").itemsize
+
+
+def _slug(name: str) -> str:
+    return quote(name, safe=" -_")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _point_keys(values: list, width: int) -> list[str] | None:
+    if not values or not isinstance(values[0], dict):
+        return None
+    first = values[0]
+    return [next((key for key in keys if key in first), keys[0]) for keys in _DICT_KEYS[width]]
+
+
+def _encode_series(series: ChartSeries, file_name: str | None) -> tuple[dict, array]:
+    """Meta entry and flat float64 data (columns one after another) of a series"""
+    columns = series.to_columns()
+    data = array("d")
+    for column in columns.values():
+        data.extend(column)
+    meta = dict(
+        file=file_name,
+        name=series.name,
+        unit=series.unit,
+        index=series.index,
+        seriesType=int(series.seriesType),
+        color=series.color,
+        scatterMarkerSymbol=series.scatterMarkerSymbol,
+        columns=list(columns),
+        length=len(series.values),
+        pointKeys=_point_keys(series.values, len(columns)),
+    )
+    return meta, data
+
+
+class StoredSeries:
+    """
+    A chart series backed by a read-only memory map
+
+    `columns` are zero-copy float64 memoryviews over the file, processes opening the
+    same series share the page cache. Series that were not stored hold `data` in memory.
+    """
+
+    def __init__(self, path: Path | None, meta: dict, data: array | None = None):
+        self.name: str = meta["name"]
+        self.unit: str = meta["unit"]
+        self.index: int = meta["index"]
+        self.seriesType = ChartSeriesTypeEnum(meta["seriesType"])
+        self.color: str | None = meta.get("color")
+        self.scatterMarkerSymbol: str | None = meta.get("scatterMarkerSymbol")
+        self.column_names: tuple[str, ...] = tuple(meta["columns"])
+        self.length: int = meta["length"]
+        # keys of dict points (`{"x": ..., "y": ...}`), None when the series had list points
+        self.point_keys: list[str] | None = meta.get("pointKeys")
+        self._buffer: mmap.mmap | array | None = data
+        if data is not None:
+            flat = memoryview(data)
+        elif self.length:
+            with open(path, "rb") as f:  # type: ignore[arg-type]
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            flat = memoryview(self._buffer).cast("d")
+        else:
+            flat = memoryview(array("d"))
+        self.columns: dict[str, memoryview] = {
+            name: flat[i * self.length : (i + 1) * self.length] for i, name in enumerate(self.column_names)
+        }
+
+    def __len__(self) -> int:
+        return self.length
+
+    def to_numpy(self):
+        """Zero-copy (columns, points) float64 array over the mapped file"""
+        import numpy as np
+
+        if not self.length:
+            return np.empty((len(self.column_names), 0))
+        return np.frombuffer(self._buffer, dtype=np.float64).reshape(len(self.column_names), self.length)
+
+    def to_series(self) -> ChartSeries:
+        """Copy back into a ChartSeries, with points in the list or dict form they were stored from"""
+        if self.point_keys is None:
+            values = [list(point) for point in zip(*self.columns.values())]
+        else:
+            # NaN columns were missing from the original dict point
+            values = [
+                {key: value for key, value in zip(self.point_keys, point) if value == value}
+                for point in zip(*self.columns.values())
+            ]
+        return ChartSeries.model_construct(
+            name=self.name,
+            unit=self.unit,
+            values=values,
+            index=self.index,
+            seriesType=self.seriesType,
+            color=self.color,
+            scatterMarkerSymbol=self.scatterMarkerSymbol,
+        )
+
+
+class StoredChart:
+    def __init__(self, name: str, chart_type: ChartTypeEnum, series: dict[str, StoredSeries]):
+        self.name = name
+        self.chartType = chart_type
+        self.series = series
+
+    def to_chart(self) -> Chart:
+        series = {name: s.to_series() for name, s in self.series.items()}
+        return Chart.model_construct(name=self.name, chartType=self.chartType, series=series)
+
+
+class ChartStore:
+    """
+    Local on-disk cache of decoded charts
+
+    Layout: `<root>/<backtest id>/<chart>/meta.json` describes the chart and each
+    series is a `<series>.<generation>.f64` file holding its float64 columns one after
+    another. A put writes new series files under a fresh generation and then atomically
+    replaces meta.json, so readers see either the old or the new chart, never a mix.
+    Afterwards it removes the files of the generation it replaced; with concurrent puts
+    of the same chart the losing generation's files may be left behind, never the
+    current one's removed.
+    """
+
+    def __init__(self, root: str | os.PathLike):
+        self.root = Path(root)
+
+    def _chart_dir(self, backtest_id: str, chart_name: str) -> Path:
+        return self.root / _slug(backtest_id) / _slug(chart_name)
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        backtest_id, chart_name = key
+        return (self._chart_dir(backtest_id, chart_name) / _META).exists()
+
+    def put(self, backtest_id: str, chart: Chart) -> None:
+        chart_dir = self._chart_dir(backtest_id, chart.name)
+        chart_dir.mkdir(parents=True, exist_ok=True)
+        generation = uuid.uuid4().hex[:12]
+        series_meta = {}
+        for key, series in chart.series.items():
+            file_name = f"{_slug(key)}.{generation}.f64"
+            series_meta[key], data = _encode_series(series, file_name)
+            _atomic_write(chart_dir / file_name, data.tobytes())
+        meta = dict(name=chart.name, chartType=int(chart.chartType), series=series_meta)
+        replaced = self._read_meta(chart_dir)
+        # the only commit step, the new series files are unreachable until here
+        _atomic_write(chart_dir / _META, json.dumps(meta).encode())
+        if replaced is None:
+            return
+        for entry in json.loads(replaced)["series"].values():
+            try:
+                (chart_dir / entry["file"]).unlink()
+            except OSError:
+                # removed by a concurrent put, or still mapped on a platform that refuses
+                pass
+
+    @staticmethod
+    def _read_meta(chart_dir: Path) -> str | None:
+        try:
+            return (chart_dir / _META).read_text()
+        except FileNotFoundError:
+            return None
+
+    def get(self, backtest_id: str, chart_name: str) -> StoredChart | None:
+        """The stored chart, None if it is not stored or its files are missing"""
+        chart_dir = self._chart_dir(backtest_id, chart_name)
+        text = self._read_meta(chart_dir)
+        while text is not None:
+            meta = json.loads(text)
+            try:
+                series = {key: StoredSeries(chart_dir / s["file"], s) for key, s in meta["series"].items()}
+            except FileNotFoundError:
+                # only a concurrent put replacing meta.json makes it worth reading again
+                previous, text = text, self._read_meta(chart_dir)
+                if text == previous:
+                    return None
+                continue
+            return StoredChart(meta["name"], ChartTypeEnum(meta["chartType"]), series)
+        return None
+
+    def fetch(self, client: "QCClient", project_id, backtest_id: str, name: str, count: int = 50_000) -> StoredChart:
+        """
+        Return the stored chart, reading it through `client` on a miss
+
+        The chart is only stored once the backtest has completed, charts of running
+        backtests are returned from memory and read again on the next fetch.
+        """
+        stored = self.get(backtest_id, name)
+        if stored is not None:
+            return stored
+        response = client.backtests.chart.read(project_id, backtest_id, name, count)
+        if response.chart is None:
+            raise RuntimeError(f"Chart {name} is not available for backtest {backtest_id}")
+        chart = response.chart
+        if client.backtests.read(project_id, backtest_id).backtest.completed:
+            self.put(backtest_id, chart)
+            stored = self.get(backtest_id, name)
+            if stored is not None:
+                return stored
+        series = {}
+        for key, chart_series in chart.series.items():
+            meta, data = _encode_series(chart_series, None)
+            series[key] = StoredSeries(None, meta, data)
+        return StoredChart(chart.name, chart.chartType, series)
+
+    def delete(self, backtest_id: str, chart_name: str | None = None) -> None:
+        """Remove one chart, or every chart of the backtest when `chart_name` is None"""
+        path = self.root / _slug(backtest_id)
+        if chart_name is not None:
+            path = self._chart_dir(backtest_id, chart_name)
+        shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..analysis import StatisticsMatrix
+    from ..models import BacktestSummaryResult, Chart
+    from ..models._backtest_models import BacktestResult
+
+
+class OptimizationResults:
+    """Every backtest of one optimization, fetched together"""
+
+    def __init__(self, optimization_id: str, summaries: list["BacktestSummaryResult"]):
+        self.optimization_id = optimization_id
+        self.summaries = summaries
+        self.backtests: dict[str, "BacktestResult"] = {}
+        self.charts: dict[str, dict[str, "Chart"]] = {}
+        self.errors: dict[str, Exception] = {}
+
+    def __len__(self) -> int:
+        return len(self.summaries)
+
+    def table(self, runtime: bool = False) -> "StatisticsMatrix":
+        """Parameter x statistics table, one row per successfully read backtest"""
+        from ..analysis import StatisticsMatrix
+
+        return StatisticsMatrix.from_backtests(self.backtests.values(), runtime=runtime)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
-from pydantic import BaseModel
+from typing import TYPE_CHECKING, Iterator, List
 from ...models import Order
+from ...models._base import QCModel
+from ...models._intern import intern_orders_response
+from ...models._registry import enable_json_fast_path, register_finalizer
 
 if TYPE_CHECKING:
     from ..._client import QCClient
@@ -24,25 +26,35 @@ class OrdersEndpoint:
             response_type=BacktestOrdersResponse,
         )
 
-    def read_all(self, project_id, backtest_id) -> List["Order"]:
-        batch_size = 100
+    def iter_pages(self, project_id, backtest_id, batch_size: int = 100) -> Iterator[List["Order"]]:
+        """Yield the orders one page at a time, so callers can process them without holding all of them"""
         start = 0
-        end = start + batch_size
-        orders = order_batch = self.read(project_id, backtest_id, start, end).orders
-        breakpoint()
-        while len(order_batch) >= batch_size:
+        while True:
+            order_batch = self.read(project_id, backtest_id, start, start + batch_size).orders
+            if order_batch:
+                yield order_batch
+            if len(order_batch) < batch_size:
+                return
             start += batch_size
-            end += batch_size
-            order_batch = self.read(project_id, backtest_id, start, end).orders
+
+    def read_all(self, project_id, backtest_id) -> List["Order"]:
+        orders: List["Order"] = []
+        for order_batch in self.iter_pages(project_id, backtest_id):
             orders.extend(order_batch)
         return orders
 
 
-class BacktestOrdersResponse(BaseModel):
+class BacktestOrdersResponse(QCModel):
     orders: list[Order]
     length: int
 
 
+# pages of up to 100 orders with nested events, validated straight from the response body
+enable_json_fast_path(BacktestOrdersResponse)
+# long histories repeat the same symbols and strings, share them between orders
+register_finalizer(BacktestOrdersResponse, intern_orders_response)
+
+
 """
 class OrderStatusEnum(Enum):
     NEW = 0
@@ -0,0 +1,341 @@
+"""
+Bookkeeping for parameter sweeps: which (compiled code, parameters) points already ran
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping
+
+from ._wait import is_finished
+
+if TYPE_CHECKING:
+    from ..models import BacktestResponse
+    from . import Backtests
+
+# rule(progress 0-1, statistics) -> True to prune, statistics as in StatisticsMatrix columns
+PruneRuleFn = Callable[[float, Mapping[str, float]], bool]
+
+
+def _normalize_value(value) -> str:
+    # parameterSet values come back as strings, 10, 10.0 and "10" are the same point
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return str(value)
+    return str(int(number)) if number.is_integer() else repr(number)
+
+
+def parameter_key(parameters: Mapping[str, Any] | list | None) -> str:
+    """
+    Canonical text form of a parameter set, equal for equal points
+
+    parameters: name -> value, or the `[{"name": ..., "value": ...}]` form of parameterSet
+    """
+    if isinstance(parameters, list):
+        parameters = {item["name"]: item["value"] for item in parameters}
+    items = {str(name): _normalize_value(value) for name, value in (parameters or {}).items()}
+    return json.dumps(items, sort_keys=True, separators=(",", ":"))
+
+
+def sweep_backtest_name(parameters: Mapping[str, Any], backtest_name: str | None = None) -> str:
+    """`backtest_name` formatted with the parameters, defaults to listing them"""
+    if backtest_name is not None:
+        return backtest_name.format(**parameters)
+    return " ".join(f"{name}={value}" for name, value in parameters.items()) or "backtest"
+
+
+@contextmanager
+def _file_lock(path: Path):
+    """Exclusive lock on `path` across processes, blocks until it is free"""
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class RunLedger:
+    """
+    Maps compile signature + parameter set to the backtest that ran them
+
+    The API does not report which compile a backtest ran, so the link is recorded
+    when launching. With a `path` the ledger is kept in a JSON file, which lets
+    resumed or concurrent sweeps of the same code find each other's runs. Writers
+    (threads and processes) take `<path>.lock` while merging into the file.
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None):
+        self.path = None if path is None else Path(path)
+        self._runs: dict[str, dict[str, str]] = {}
+        self._forgotten: set[tuple[str, str]] = set()
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            self._runs = json.loads(self.path.read_text())
+
+    def get(self, signature: str, parameters) -> str | None:
+        return self._runs.get(signature, {}).get(parameter_key(parameters))
+
+    def runs(self, signature: str) -> dict[str, str]:
+        """parameter key -> backtest id of everything recorded for `signature`"""
+        return dict(self._runs.get(signature, {}))
+
+    def record(self, signature: str, parameters, backtest_id: str) -> None:
+        key = parameter_key(parameters)
+        with self._lock:
+            self._runs.setdefault(signature, {})[key] = backtest_id
+            self._forgotten.discard((signature, key))
+            self._save()
+
+    def forget(self, signature: str, parameters) -> None:
+        key = parameter_key(parameters)
+        with self._lock:
+            self._runs.get(signature, {}).pop(key, None)
+            self._forgotten.add((signature, key))
+            self._save()
+
+    def _save(self):
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with _file_lock(self.path.with_name(f"{self.path.name}.lock")):
+            # merge with runs recorded by other writers since we loaded
+            if self.path.exists():
+                on_disk = json.loads(self.path.read_text())
+                for signature, runs in on_disk.items():
+                    merged = {**runs, **self._runs.get(signature, {})}
+                    self._runs[signature] = {k: v for k, v in merged.items() if (signature, k) not in self._forgotten}
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(json.dumps(self._runs, indent=1, sort_keys=True))
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+
+class PruneRule:
+    """
+    Prune once the backtest is `after` (0-1) through and `statistic` is above/below a bound
+
+    statistic: a StatisticsMatrix column such as "drawdown", "sharpe_ratio" or
+        "runtime.net_profit", percentages are fractions
+    """
+
+    def __init__(self, statistic: str, *, above: float | None = None, below: float | None = None, after: float = 0.0):
+        if above is None and below is None:
+            raise ValueError("PruneRule needs `above` or `below`")
+        self.statistic = statistic
+        self.above = above
+        self.below = below
+        self.after = after
+
+    def __call__(self, progress: float, statistics: Mapping[str, float]) -> bool:
+        if progress < self.after:
+            return False
+        value = statistics.get(self.statistic, float("nan"))
+        if value != value:
+            return False
+        return (self.above is not None and value > self.above) or (self.below is not None and value < self.below)
+
+    def __repr__(self) -> str:
+        bounds = [f"{op} {bound}" for op, bound in ((">", self.above), ("<", self.below)) if bound is not None]
+        return f"{self.statistic} {' or '.join(bounds)} after {self.after:.0%}"
+
+
+class SweepResults:
+    """Outcome of a sweep, keyed by backtest id"""
+
+    def __init__(self):
+        self.parameters: dict[str, dict] = {}
+        self.completed: dict[str, "BacktestResponse"] = {}
+        # backtest id -> the rule that pruned it
+        self.pruned: dict[str, str] = {}
+        # backtest id -> last failed read/delete, given up on after `max_failures` in a row
+        self.errors: dict[str, Exception] = {}
+
+    def table(self, runtime: bool = False):
+        """Parameter x statistics table of the completed backtests"""
+        from ..analysis import StatisticsMatrix
+
+        return StatisticsMatrix.from_backtests(self.completed.values(), runtime=runtime)
+
+
+class SweepMonitor:
+    """
+    Runs a parameter sweep on at most `max_concurrent` nodes, pruning losing runs
+
+    Every `interval` seconds the running backtests are read and their statistics and
+    runtime statistics checked against `rules`. A pruned backtest is deleted, which
+    frees its node for the next pending parameter point.
+
+    ledger/signature: reuse runs of the same code and parameters, see `RunLedger`
+    delete: delete pruned backtests, otherwise they are only no longer waited for
+    max_failures: consecutive failed reads after which a backtest is given up on (kept in
+        `results.errors`), earlier failures are retried on the next poll. A given up backtest
+        keeps its slot until it reads as finished or, with `delete`, is deleted
+    """
+
+    def __init__(
+        self,
+        backtests: "Backtests",
+        project_id,
+        compile_id: str,
+        parameter_sets: Iterable[dict],
+        rules: Iterable[PruneRuleFn] = (),
+        *,
+        max_concurrent: int = 4,
+        signature: str | None = None,
+        ledger: RunLedger | None = None,
+        backtest_name: str | None = None,
+        delete: bool = True,
+        max_workers: int = 8,
+        max_failures: int = 5,
+    ):
+        if (ledger is None) != (signature is None):
+            raise ValueError("`ledger` and `signature` are used together")
+        self.backtests = backtests
+        self.project_id = project_id
+        self.compile_id = compile_id
+        self.pending = list(parameter_sets)
+        self.rules = list(rules)
+        self.max_concurrent = max_concurrent
+        self.signature = signature
+        self.ledger = ledger
+        self.backtest_name = backtest_name
+        self.delete = delete
+        self.max_workers = max_workers
+        self.max_failures = max_failures
+        self.running: set[str] = set()
+        self.results = SweepResults()
+        self._failures: dict[str, int] = {}
+        # given up on, but possibly still holding a node
+        self._abandoned: set[str] = set()
+
+    def _launch(self, reusable: dict[str, str] | None = None) -> dict[str, str] | None:
+        """Fill free slots, listing the ledger's reusable runs at most once; returns them for the next call"""
+        while self.pending and len(self.running) + len(self._abandoned) < self.max_concurrent:
+            parameters = self.pending.pop(0)
+            name = sweep_backtest_name(parameters, self.backtest_name)
+            if self.ledger is not None:
+                if reusable is None:
+                    reusable = self.backtests.reusable_runs(self.project_id, self.signature, self.ledger)
+                key = parameter_key(parameters)
+                backtest_id = reusable.get(key)
+                if backtest_id is None:
+                    response = self.backtests.create(self.project_id, self.compile_id, name, parameters)
+                    backtest_id = response.backtest.backtest_id
+                    self.ledger.record(self.signature, parameters, backtest_id)
+                    reusable[key] = backtest_id
+            else:
+                response = self.backtests.create(self.project_id, self.compile_id, name, parameters)
+                backtest_id = response.backtest.backtest_id
+            self.running.add(backtest_id)
+            self.results.parameters[backtest_id] = parameters
+        return reusable
+
+    def _pruned_by(self, response: "BacktestResponse") -> PruneRuleFn | None:
+        from ..analysis import StatisticsMatrix
+
+        if not self.rules:
+            return None
+        statistics = StatisticsMatrix.from_backtests([response], parameters=False).to_records()[0]
+        progress = response.backtest.progress
+        return next((rule for rule in self.rules if rule(progress, statistics)), None)
+
+    def _done(self, backtest_id: str) -> None:
+        self.running.discard(backtest_id)
+        self._failures.pop(backtest_id, None)
+        self.results.errors.pop(backtest_id, None)
+
+    def _failed(self, backtest_id: str, error: Exception) -> None:
+        self.results.errors[backtest_id] = error
+        self._failures[backtest_id] = self._failures.get(backtest_id, 0) + 1
+        if self._failures[backtest_id] >= self.max_failures:
+            self.running.discard(backtest_id)
+            self._abandoned.add(backtest_id)
+
+    def _release_abandoned(self) -> None:
+        """Free the slots of given up backtests that have stopped or could be deleted"""
+        for backtest_id, response, error in self.backtests.read_many(
+            self.project_id, sorted(self._abandoned), max_workers=self.max_workers
+        ):
+            if error is None and (response.backtest.completed or is_finished(response.backtest.status)):
+                self._abandoned.discard(backtest_id)
+            elif self.delete:
+                try:
+                    self.backtests.delete(self.project_id, backtest_id)
+                except Exception:
+                    continue
+                self._abandoned.discard(backtest_id)
+
+    def poll(self) -> None:
+        """Launch pending points into free slots, then check every running backtest once"""
+        if self._abandoned and self.pending:
+            self._release_abandoned()
+        reusable = self._launch()
+        if not self.running:
+            return
+        for backtest_id, response, error in self.backtests.read_many(
+            self.project_id, sorted(self.running), max_workers=self.max_workers
+        ):
+            if error is not None:
+                self._failed(backtest_id, error)
+                continue
+            backtest = response.backtest
+            if backtest.completed or is_finished(backtest.status):
+                self.results.completed[backtest_id] = response
+                self._done(backtest_id)
+                continue
+            rule = self._pruned_by(response)
+            if rule is None:
+                self._failures.pop(backtest_id, None)
+                self.results.errors.pop(backtest_id, None)
+                continue
+            if self.delete:
+                try:
+                    self.backtests.delete(self.project_id, backtest_id)
+                except Exception as e:
+                    # still holds its node, the rule is checked again on the next poll
+                    self._failed(backtest_id, e)
+                    continue
+            # a pruned run is not a valid result for the point, whether or not it was deleted
+            if self.ledger is not None:
+                self.ledger.forget(self.signature, self.results.parameters[backtest_id])
+                if reusable is not None:
+                    reusable.pop(parameter_key(self.results.parameters[backtest_id]), None)
+            self.results.pruned[backtest_id] = repr(rule)
+            self._done(backtest_id)
+        self._launch(reusable)
+
+    def run(self, *, interval: float = 15.0, timeout: float | None = None) -> SweepResults:
+        """Poll until every parameter point has completed, been pruned or failed `max_failures` times"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self.poll()
+            if not self.running and not self.pending:
+                return self.results
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Sweep still running: {sorted(self.running)}, {len(self.pending)} pending")
+            time.sleep(interval)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import time
+
+# summary statuses of backtests that will not make further progress
+_FINISHED_STATUSES = ("Completed.", "Runtime Error")
+
+
+def is_finished(status: str) -> bool:
+    # decided from the status alone, progress reaches its maximum before the result is final
+    return status in _FINISHED_STATUSES or "Error" in status
+
+
+def summary_progress(progress) -> float:
+    """Progress of a list summary as a 0-1 fraction, the list endpoint reports whole percent"""
+    return float(progress or 0) / 100
+
+
+class ProgressTracker:
+    """
+    Picks the next polling interval from the observed progress rate
+
+    The interval is half the shortest estimated time to completion, clamped to
+    [min_interval, max_interval]. Without a rate yet, it backs off geometrically.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._interval = min_interval
+        self._last: dict[str, tuple[float, float]] = {}
+
+    def update(self, progress: dict[str, float], now: float | None = None) -> float:
+        now = time.monotonic() if now is None else now
+        etas = []
+        for backtest_id, value in progress.items():
+            previous = self._last.get(backtest_id)
+            if previous is not None and value > previous[1] and now > previous[0]:
+                rate = (value - previous[1]) / (now - previous[0])
+                etas.append((1.0 - value) / rate)
+            self._last[backtest_id] = (now, value)
+        if etas:
+            self._interval = min(etas) / 2
+        else:
+            self._interval *= 1.5
+        self._interval = min(max(self._interval, self.min_interval), self.max_interval)
+        return self._interval
+
+    def forget(self, backtest_id: str) -> None:
+        self._last.pop(backtest_id, None)
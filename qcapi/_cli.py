@@ -0,0 +1,216 @@
+"""
+`qcapi` command line: bulk exports as NDJSON or Parquet
+
+Rows are written as each page/backtest/chart arrives so exports run in constant
+memory and can be piped into other tools (`qcapi orders 123 --live | jq ...`).
+Credentials come from --user-id/--token or the USER_ID/TOKEN environment variables.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from contextlib import ExitStack
+from typing import IO, TYPE_CHECKING, Any, Iterable, Iterator
+
+
+if TYPE_CHECKING:
+    from ._client import QCClient
+
+DEFAULT_URL = "https://www.quantconnect.com/api/v2"
+Rows = Iterator[list[dict[str, Any]]]
+
+
+class NDJSONWriter:
+    def __init__(self, stream: IO[bytes]):
+        self._stream = stream
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._stream.write(b"".join(json.dumps(row, default=str).encode() + b"\n" for row in rows))
+        self._stream.flush()
+
+    def close(self) -> None:
+        pass
+
+
+class ParquetWriter:
+    """
+    Each batch of rows becomes a row group, the schema is fixed by the first batch
+
+    Nested values (dicts and lists such as `symbol`, `events` or `properties`) are written
+    as JSON strings, so their shape may vary between rows. Columns that are empty in the
+    first batch are typed as strings and hold JSON for whatever arrives later, unless they
+    are listed in `float_columns`.
+    """
+
+    def __init__(self, stream: IO[bytes], float_columns: Iterable[str] = ()):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise SystemExit("Parquet export requires pyarrow: pip install gcapi[parquet]") from e
+        self._stream = stream
+        self._writer = None
+        self._json_columns: set[str] = set()
+        self._float_columns = set(float_columns)
+
+    def _encode(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return [
+            {
+                key: json.dumps(value, default=str)
+                if value is not None and (key in self._json_columns or isinstance(value, (dict, list)))
+                else value
+                for key, value in row.items()
+            }
+            for row in rows
+        ]
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not rows:
+            return
+        if self._writer is None:
+            schema = pa.Table.from_pylist(self._encode(rows)).schema
+            for i, field in enumerate(schema):
+                if pa.types.is_null(field.type) and field.name in self._float_columns:
+                    schema = schema.set(i, pa.field(field.name, pa.float64()))
+                elif pa.types.is_null(field.type):
+                    self._json_columns.add(field.name)
+                    schema = schema.set(i, pa.field(field.name, pa.string()))
+            self._writer = pq.ParquetWriter(self._stream, schema)
+        unknown = {key for row in rows for key in row} - set(self._writer.schema.names)
+        if unknown:
+            raise ValueError(f"Columns not in the first batch, the Parquet schema is fixed: {sorted(unknown)}")
+        self._writer.write_table(pa.Table.from_pylist(self._encode(rows), schema=self._writer.schema))
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+def _dump(model) -> dict[str, Any]:
+    return model.model_dump(mode="json", by_alias=True)
+
+
+def backtest_rows(client: "QCClient", args) -> Rows:
+    response = client.backtests.list(args.project_id, include_statistics=not args.no_statistics)
+    yield [_dump(bt) for bt in response.backtests]
+
+
+def order_rows(client: "QCClient", args) -> Rows:
+    if args.live:
+        pages = client.live.orders.iter_pages(args.project_id)
+    else:
+        pages = client.backtests.orders.iter_pages(args.project_id, args.backtest)
+    for page in pages:
+        yield [_dump(order) for order in page]
+
+
+CHART_COLUMNS = ("time", "value", "open", "high", "low", "close")
+
+
+def chart_rows(client: "QCClient", args) -> Rows:
+    """
+    One row per chart point: chart, series and `CHART_COLUMNS`
+
+    Every series type shares the same columns so charts mixing candles and points fit
+    one schema; columns a series does not have are null.
+    """
+    names = args.chart or list(client.backtests.read(args.project_id, args.backtest).backtest.charts)
+    for name in names:
+        chart = client.backtests.chart.read_complete(args.project_id, args.backtest, name, args.count)
+        for series_name, series in chart.series.items():
+            columns = series.to_columns()
+            missing = [None] * len(series.values)
+            yield [
+                dict(chart=name, series=series_name, **dict(zip(CHART_COLUMNS, point)))
+                for point in zip(*(columns.get(key, missing) for key in CHART_COLUMNS))
+            ]
+
+
+def result_rows(client: "QCClient", args) -> Rows:
+    ids: Iterable[str] = args.backtest or [bt.backtestId for bt in client.backtests.list(args.project_id).backtests]
+    # read_many keeps at most `workers` results in flight, each is written and dropped in turn
+    for backtest_id, response, error in client.backtests.read_many(args.project_id, ids, max_workers=args.workers):
+        if error is not None:
+            if args.quarantine is None:
+                raise error
+            print(f"qcapi: skipped backtest {backtest_id}: {error}", file=sys.stderr)
+            continue
+        yield [_dump(response.backtest)]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="qcapi", description="Export QuantConnect data as NDJSON or Parquet")
+    parser.add_argument("--url", default=os.environ.get("QC_URL", DEFAULT_URL))
+    parser.add_argument("--user-id", default=os.environ.get("USER_ID"))
+    parser.add_argument("--token", default=os.environ.get("TOKEN"))
+    parser.add_argument("--format", choices=("ndjson", "parquet"), default="ndjson")
+    parser.add_argument("-o", "--output", default="-", help="file to write, '-' for stdout (default)")
+    parser.add_argument(
+        "--quarantine", metavar="PATH", help="append records that fail validation to this NDJSON file and keep going"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    backtests = commands.add_parser("backtests", help="list the backtests of a project")
+    backtests.add_argument("project_id")
+    backtests.add_argument("--no-statistics", action="store_true")
+    backtests.set_defaults(rows=backtest_rows)
+
+    orders = commands.add_parser("orders", help="orders of a backtest or of the live deployment")
+    orders.add_argument("project_id")
+    target = orders.add_mutually_exclusive_group(required=True)
+    target.add_argument("--backtest")
+    target.add_argument("--live", action="store_true")
+    orders.set_defaults(rows=order_rows)
+
+    charts = commands.add_parser("charts", help="chart points of a backtest")
+    charts.add_argument("project_id")
+    charts.add_argument("backtest")
+    charts.add_argument("--chart", action="append", help="chart to export, repeatable (default: all charts)")
+    charts.add_argument("--count", type=int, default=50_000)
+    charts.set_defaults(rows=chart_rows, float_columns=CHART_COLUMNS)
+
+    results = commands.add_parser("results", help="full backtest results")
+    results.add_argument("project_id")
+    results.add_argument("backtest", nargs="*", help="backtests to export (default: all in the project)")
+    results.add_argument("--workers", type=int, default=4, help="concurrent reads, bounds memory use (default 4)")
+    results.set_defaults(rows=result_rows)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if not args.user_id or not args.token:
+        raise SystemExit("Set USER_ID and TOKEN (or pass --user-id and --token)")
+    from ._client import QCClient
+
+    client = QCClient(args.url, args.user_id, args.token)
+    stream = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    writer: ParquetWriter | NDJSONWriter
+    if args.format == "parquet":
+        writer = ParquetWriter(stream, getattr(args, "float_columns", ()))
+    else:
+        writer = NDJSONWriter(stream)
+    with ExitStack() as stack:
+        quarantine = None
+        if args.quarantine is not None:
+            from ._quarantine import Quarantine
+
+            quarantine = stack.enter_context(client.tolerant(Quarantine(args.quarantine)))
+        try:
+            for rows in args.rows(client, args):
+                writer.write(rows)
+        except BrokenPipeError:
+            # reader went away (e.g. `| head`), nothing left to do
+            return 0
+        finally:
+            writer.close()
+            if stream is not sys.stdout.buffer:
+                stream.close()
+            if quarantine:
+                print(quarantine.report(), file=sys.stderr)
+    return 0
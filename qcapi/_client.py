@@ -1,42 +1,133 @@
 import time
 import hashlib
 import base64
-from requests import Session, Request
+import json as _json
+import threading
+from contextlib import contextmanager
+from functools import cached_property
 from pprint import pformat
 from logging import getLogger
 
-from qcapi._object import ObjectEndpoint
-from ._backtests import Backtests
-from ._live import LiveEndpoint
-from ._compile import CompileEndpoint
 from .errors import QCException
-from typing import Type, TypeVar, TYPE_CHECKING, overload
+from typing import Iterator, Type, TypeVar, TYPE_CHECKING, overload
 
+# endpoints, their models and requests are imported on first use to keep `import qcapi` cheap
 if TYPE_CHECKING:
-    from requests import Response
+    from requests import Response, Session
+    from ._backtests import Backtests
+    from ._compile import CompileEndpoint
+    from ._live import LiveEndpoint
+    from ._object import ObjectEndpoint
+    from ._quarantine import Quarantine
 
 T = TypeVar("T")
 
 _LOG = getLogger("qcapi")
 
+# only reads are coalesced, create/update/delete always go out
+_COALESCED_METHODS = frozenset({"GET"})
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class _SingleFlight:
+    """Runs at most one call per key at a time, concurrent callers with the same key share its outcome"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
 
 class QCClient:
     url: str = ""
     token: str = ""
-    backtests: "Backtests"
 
-    def __init__(self, url, user_id, token, *, timeout=30):
+    def __init__(self, url, user_id, token, *, timeout=30, coalesce=True):
+        """
+        coalesce: share one in-flight HTTP call (and its parsed result) between threads
+            making an identical read at the same time
+        """
         self.url = url
         self.user = user_id
         self.token = token
         self._timeout = timeout
-        self.backtests = Backtests(self, "/backtests")
-        self.live = LiveEndpoint(self, "/live")
-        self.object = ObjectEndpoint(self, "/object")
-        self.compile = CompileEndpoint(self, "/compile")
+        self._coalesce = coalesce
+        self._in_flight = _SingleFlight()
+        self._quarantine: "Quarantine | None" = None
+
+    @contextmanager
+    def tolerant(self, quarantine: "Quarantine | None" = None) -> Iterator["Quarantine"]:
+        """
+        Quarantine responses that fail validation instead of writing errors.json and raising
+
+        Inside the block, list items that fail (e.g. one order of a page) are set aside in
+        the quarantine and the rest of the response is returned. Applies to every thread
+        using this client, meant for bulk jobs such as `read_many` or `orders.read_all`.
+        """
+        from ._quarantine import Quarantine
+
+        previous = self._quarantine
+        self._quarantine = quarantine if quarantine is not None else Quarantine()
+        try:
+            yield self._quarantine
+        finally:
+            self._quarantine = previous
+
+    @cached_property
+    def backtests(self) -> "Backtests":
+        from ._backtests import Backtests
+
+        return Backtests(self, "/backtests")
+
+    @cached_property
+    def live(self) -> "LiveEndpoint":
+        from ._live import LiveEndpoint
+
+        return LiveEndpoint(self, "/live")
+
+    @cached_property
+    def object(self) -> "ObjectEndpoint":
+        from ._object import ObjectEndpoint
+
+        return ObjectEndpoint(self, "/object")
+
+    @cached_property
+    def compile(self) -> "CompileEndpoint":
+        from ._compile import CompileEndpoint
+
+        return CompileEndpoint(self, "/compile")
 
     @property
-    def _session(self) -> Session:
+    def _session(self) -> "Session":
+        from requests import Session
+
         # Get timestamp
         # not sure of the importance here but we could make this smarter by just redoing the
         # timestamp code every X seconds
@@ -55,6 +146,18 @@ class QCClient:
         session.headers.update(headers)
         return session
 
+    def stream(
+        self, method: str, url: str, json: dict | None = None, params: dict | None = None, chunk_size: int = 1 << 16
+    ) -> Iterator[bytes]:
+        """Send a request and yield the raw response body in chunks as it arrives"""
+        from requests import Request
+
+        session = self._session
+        prepared_request = session.prepare_request(Request(method, f"{self.url}{url}", json=json, params=params))
+        with session.send(prepared_request, timeout=self._timeout, stream=True) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size)
+
     @overload
     def request(
         self, method: str, url: str, *, json: dict | None = None, params: dict | None = None, response_type: Type[T]
@@ -73,15 +176,43 @@ class QCClient:
         params: dict | None = None,
         response_type: Type[T] | None = None,
     ) -> T | "Response":
+        if not self._coalesce or method.upper() not in _COALESCED_METHODS:
+            return self._request(method, url, json, params, response_type)
+        key = (
+            method.upper(),
+            url,
+            _json.dumps(json, sort_keys=True, default=str),
+            _json.dumps(params, sort_keys=True, default=str),
+            response_type,
+        )
+        return self._in_flight.do(key, lambda: self._request(method, url, json, params, response_type))
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        json: dict | None,
+        params: dict | None,
+        response_type,
+    ):
+        from requests import Request
+
+        from .models._registry import decode_json, has_json_fast_path
+
         request = Request(method, f"{self.url}{url}", json=json, params=params)
         prepared_request = self._session.prepare_request(request)
+        json_fast_path = response_type is not None and has_json_fast_path(response_type)
         first_time = time.time()
         while True:
             response = self._session.send(prepared_request, timeout=self._timeout)
             response.raise_for_status()
+            if json_fast_path:
+                result = decode_json(response_type, response.content)
+                if result is not None:
+                    return result
             resp_data = response.json()
             # if loading, keep polling until we hit the timeout
-            if response.json().get("status", None) == "loading" and time.time() - first_time < self._timeout * 2:
+            if resp_data.get("status", None) == "loading" and time.time() - first_time < self._timeout * 2:
                 continue
             elif not resp_data.get("success", True):
                 errors = resp_data.get("errors", None)
@@ -98,8 +229,12 @@ class QCClient:
                 break
 
         if response_type:
+            from .models._registry import validate
+
+            if self._quarantine is not None:
+                return self._quarantine.validate(response_type, resp_data, method=method, url=url, json=json)
             try:
-                return response_type(**response.json())
+                return validate(response_type, resp_data)
             except Exception:
                 with open("errors.json", "w") as f:
                     f.write(pformat(response.json()))
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
 from typing import TYPE_CHECKING, Literal, Optional
 
+from ..models._base import QCModel
+
 if TYPE_CHECKING:
     from .._client import QCClient
 
@@ -27,7 +28,7 @@ class CompileEndpoint:
         )
 
 
-class CompileReadResponse(BaseModel):
+class CompileReadResponse(QCModel):
     compileId: str
     state: Literal["InQueue", "BuildSuccess", "BuildError"]
     success: bool
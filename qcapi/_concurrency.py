@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_concurrent(
+    fn: Callable[[T], R], items: Iterable[T], max_workers: int = 8, ordered: bool = False
+) -> Iterator[tuple[T, R | None, Exception | None]]:
+    """
+    Run `fn` over `items` on a thread pool, yielding `(item, result, error)` per item
+
+    Exceptions are captured per item so one failure does not stop the batch. Results
+    are yielded as they complete, or in input order when `ordered` is set. At most
+    `max_workers` items are in flight and `items` is consumed lazily, so only that many
+    results are held at a time.
+    """
+    items = iter(items)
+    max_workers = max(1, max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # in submission order, so the head is the next result when ordered
+        window: deque[tuple[Future, T]] = deque((pool.submit(fn, item), item) for item in islice(items, max_workers))
+        while window:
+            if ordered:
+                future, item = window.popleft()
+            else:
+                done, _ = wait([future for future, _ in window], return_when=FIRST_COMPLETED)
+                position = next(i for i, (future, _) in enumerate(window) if future in done)
+                future, item = window[position]
+                del window[position]
+            for next_item in islice(items, 1):
+                window.append((pool.submit(fn, next_item), next_item))
+            error = future.exception()
+            if error is not None and not isinstance(error, Exception):
+                raise error
+            result = None if error is not None else future.result()
+            del future
+            yield item, result, error  # type: ignore[misc]
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Optional
-from pydantic import BaseModel
+
+from .models._base import QCModel
 
 
 if TYPE_CHECKING:
@@ -31,7 +32,7 @@ class ObjectEndpoint:
         )
 
 
-class GetObjectStoreResponse(BaseModel):
+class GetObjectStoreResponse(QCModel):
     jobId: Optional[str]
     url: Optional[str]
     success: bool
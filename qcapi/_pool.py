@@ -0,0 +1,172 @@
+"""
+One client over several QC credentials
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from ._client import QCClient
+
+if TYPE_CHECKING:
+    from ._quarantine import Quarantine
+
+# HTTP statuses that mean "this credential is throttled", the request is retried on another one
+_THROTTLED_STATUSES = frozenset({429})
+
+
+class CredentialStats:
+    """Usage of one credential of a pool"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.launches = 0
+        self.in_flight = 0
+        self.busy_seconds = 0.0
+        self.cooldown_until = 0.0
+
+    def to_dict(self, elapsed: float) -> dict:
+        return dict(
+            requests=self.requests,
+            errors=self.errors,
+            throttled=self.throttled,
+            launches=self.launches,
+            in_flight=self.in_flight,
+            busy_seconds=self.busy_seconds,
+            utilization=self.busy_seconds / elapsed if elapsed > 0 else 0.0,
+        )
+
+
+class QCClientPool(QCClient):
+    """
+    A `QCClient` that spreads requests over several user id/token pairs
+
+    Each request goes to the credential with the fewest requests in flight (then the
+    fewest sent), skipping credentials that were throttled within `cooldown` seconds;
+    a throttled (HTTP 429) request is retried on another credential. Projects only
+    visible to one account are pinned to it with `assign_project`. With `sticky`,
+    a project is pinned to whichever credential first writes to it (compile, launch, ...).
+
+    credentials: (user_id, token) pairs
+    """
+
+    def __init__(
+        self,
+        url,
+        credentials: Iterable[tuple[str, str]],
+        *,
+        timeout=30,
+        coalesce=True,
+        sticky: bool = False,
+        cooldown: float = 60.0,
+    ):
+        super().__init__(url, None, "", timeout=timeout, coalesce=coalesce)
+        # coalescing happens once, in the pool's own `request`
+        self.clients = [
+            QCClient(url, user_id, token, timeout=timeout, coalesce=False) for user_id, token in credentials
+        ]
+        if not self.clients:
+            raise ValueError("QCClientPool needs at least one credential")
+        self.stats = {client.user: CredentialStats() for client in self.clients}
+        self.sticky = sticky
+        self.cooldown = cooldown
+        self._projects: dict[int, QCClient] = {}
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+    def assign_project(self, project_id, user_id) -> None:
+        """Send every request about `project_id` through the credential of `user_id`"""
+        client = next((client for client in self.clients if client.user == user_id), None)
+        if client is None:
+            raise KeyError(f"No credential for user {user_id}")
+        with self._lock:
+            self._projects[int(project_id)] = client
+
+    @contextmanager
+    def tolerant(self, quarantine: "Quarantine | None" = None) -> Iterator["Quarantine"]:
+        # validation happens in the per-credential clients, they share the pool's quarantine
+        with ExitStack() as stack:
+            quarantine = stack.enter_context(super().tolerant(quarantine))
+            for client in self.clients:
+                stack.enter_context(client.tolerant(quarantine))
+            yield quarantine
+
+    def utilization(self) -> dict[str, dict]:
+        """user id -> request counts, time spent in requests and its share of the pool's lifetime"""
+        elapsed = time.monotonic() - self._started
+        with self._lock:
+            return {user_id: stats.to_dict(elapsed) for user_id, stats in self.stats.items()}
+
+    def _pick(self, project_id, exclude=()) -> QCClient:
+        now = time.monotonic()
+        with self._lock:
+            pinned = None if project_id is None else self._projects.get(int(project_id))
+            if pinned is not None:
+                return pinned
+            candidates = [client for client in self.clients if client not in exclude] or self.clients
+            ready = [client for client in candidates if self.stats[client.user].cooldown_until <= now] or candidates
+            return min(ready, key=lambda client: (self.stats[client.user].in_flight, self.stats[client.user].requests))
+
+    @contextmanager
+    def _using(self, client: QCClient, method: str, url: str, project_id) -> Iterator[None]:
+        stats = self.stats[client.user]
+        with self._lock:
+            stats.in_flight += 1
+            stats.requests += 1
+        start = time.monotonic()
+        try:
+            yield
+        except Exception:
+            with self._lock:
+                stats.errors += 1
+            raise
+        else:
+            if method.upper() != "GET" and project_id is not None:
+                with self._lock:
+                    if url.endswith("/backtests/create"):
+                        stats.launches += 1
+                    if self.sticky:
+                        self._projects.setdefault(int(project_id), client)
+        finally:
+            with self._lock:
+                stats.in_flight -= 1
+                stats.busy_seconds += time.monotonic() - start
+
+    def _throttled(self, client: QCClient, error: Exception) -> bool:
+        response = getattr(error, "response", None)
+        if getattr(response, "status_code", None) not in _THROTTLED_STATUSES:
+            return False
+        with self._lock:
+            stats = self.stats[client.user]
+            stats.throttled += 1
+            stats.cooldown_until = time.monotonic() + self.cooldown
+        return True
+
+    def stream(
+        self, method: str, url: str, json: dict | None = None, params: dict | None = None, chunk_size: int = 1 << 16
+    ) -> Iterator[bytes]:
+        project_id = (json or {}).get("projectId")
+        client = self._pick(project_id)
+        with self._using(client, method, url, project_id):
+            yield from client.stream(method, url, json, params, chunk_size)
+
+    def _request(self, method: str, url: str, json: dict | None, params: dict | None, response_type):
+        project_id = (json or {}).get("projectId")
+        tried: list[QCClient] = []
+        while True:
+            client = self._pick(project_id, exclude=tried)
+            tried.append(client)
+            try:
+                with self._using(client, method, url, project_id):
+                    return client._request(method, url, json, params, response_type)
+            except Exception as e:
+                throttled = self._throttled(client, e)
+                # a pinned project cannot move, otherwise try each credential once
+                pinned = project_id is not None and int(project_id) in self._projects
+                if not throttled or pinned or len(tried) >= len(self.clients):
+                    raise
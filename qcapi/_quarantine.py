@@ -0,0 +1,135 @@
+"""
+Tolerant validation for bulk pulls: payloads that no longer match a model are set aside
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterator
+
+from pydantic import ValidationError
+
+from .models._registry import validate
+
+
+def _field_path(tp, loc: tuple) -> str:
+    # list positions are collapsed so the same drift in every item counts as one field
+    name = getattr(tp, "__name__", None) or repr(tp)
+    return ".".join([name, *("*" if isinstance(part, int) else str(part) for part in loc)])
+
+
+def _item_prefixes(errors: list[dict]) -> set[tuple] | None:
+    """
+    The list items the errors are confined to, as `(index,)` or `(field, index)` prefixes
+
+    None when an error is outside of list items, then nothing can be salvaged.
+    """
+    prefixes = set()
+    for error in errors:
+        loc = error["loc"]
+        if len(loc) >= 1 and isinstance(loc[0], int):
+            prefixes.add(loc[:1])
+        elif len(loc) >= 2 and isinstance(loc[0], str) and isinstance(loc[1], int):
+            prefixes.add(loc[:2])
+        else:
+            return None
+    return prefixes
+
+
+class QuarantinedItem:
+    """A payload that failed validation, with its errors and where it came from"""
+
+    def __init__(self, payload: Any, errors: list[dict], context: dict):
+        self.payload = payload
+        self.errors = errors
+        self.context = context
+
+    def to_dict(self) -> dict:
+        return dict(payload=self.payload, errors=self.errors, context=self.context)
+
+
+class Quarantine:
+    """
+    Collects payloads that failed validation instead of aborting the batch
+
+    When the failures are confined to items of a list (an order of a page, a backtest
+    of a list), only those items are quarantined and the rest of the response is
+    validated without them. `drift` counts the failures per field and error type.
+
+    path: if given, every quarantined item is appended to this NDJSON file
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None):
+        self.path = None if path is None else Path(path)
+        self.items: list[QuarantinedItem] = []
+        self._drift: Counter[tuple[str, str]] = Counter()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[QuarantinedItem]:
+        return iter(list(self.items))
+
+    def add(self, payload: Any, errors: list[dict], **context) -> None:
+        item = QuarantinedItem(payload, errors, context)
+        with self._lock:
+            self.items.append(item)
+            if self.path is not None:
+                with open(self.path, "a") as f:
+                    f.write(json.dumps(item.to_dict(), default=str) + "\n")
+
+    def validate(self, tp, data, **context):
+        """`validate(tp, data)`, quarantining the list items that fail, raises if nothing can be salvaged"""
+        try:
+            return validate(tp, data)
+        except ValidationError as e:
+            errors = e.errors(include_url=False)
+            with self._lock:
+                self._drift.update((_field_path(tp, error["loc"]), error["type"]) for error in errors)
+            prefixes = _item_prefixes(errors)
+            if prefixes is None:
+                self.add(data, errors, **context)
+                raise
+        return validate(tp, self._drop_items(data, errors, prefixes, context))
+
+    def _drop_items(self, data, errors: list[dict], prefixes: set[tuple], context: dict):
+        by_list: dict[Any, set[int]] = {}
+        for prefix in prefixes:
+            field = None if len(prefix) == 1 else prefix[0]
+            by_list.setdefault(field, set()).add(prefix[-1])
+        salvaged = dict(data) if isinstance(data, dict) else data
+        for field, indices in by_list.items():
+            items = data if field is None else data[field]
+            for index in sorted(indices):
+                prefix = (index,) if field is None else (field, index)
+                item_errors = [
+                    dict(error, loc=error["loc"][len(prefix) :])
+                    for error in errors
+                    if error["loc"][: len(prefix)] == prefix
+                ]
+                self.add(items[index], item_errors, field=field, index=index, **context)
+            kept = [item for i, item in enumerate(items) if i not in indices]
+            if field is None:
+                salvaged = kept
+            else:
+                salvaged[field] = kept
+        return salvaged
+
+    def drift(self) -> dict[str, dict[str, int]]:
+        """Field path -> error type -> failures, e.g. {"Order.events.*.fillPrice": {"missing": 12}}"""
+        with self._lock:
+            result: dict[str, dict[str, int]] = {}
+            for (path, error_type), count in self._drift.most_common():
+                result.setdefault(path, {})[error_type] = count
+            return result
+
+    def report(self) -> str:
+        lines = [f"{len(self.items)} quarantined payloads"]
+        for path, types in self.drift().items():
+            lines.append(f"  {path}: " + ", ".join(f"{error_type} x{count}" for error_type, count in types.items()))
+        return "\n".join(lines)
@@ -0,0 +1,295 @@
+"""
+Incremental JSON section parser
+
+Large responses are consumed chunk by chunk. Containers selected by `descend` are
+walked, every other value below them is buffered on its own and emitted as a
+`(path, value)` pair as soon as it is complete, so only one section is held in
+memory at a time. Values selected by `skip` are scanned but never buffered.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Callable, Iterable, Iterator
+
+Path = tuple
+
+_WHITESPACE = " \t\r\n"
+# a whole string (or the unterminated rest of the chunk) in one match, or a bracket
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*(?:(")|(\\)?\Z)|[{}\[\]]', re.DOTALL)
+_STRING_REST = re.compile(r'(?:[^"\\]|\\.)*(?:(")|(\\)?\Z)', re.DOTALL)
+_SCALAR_END = re.compile(r"[,\]}\s]")
+
+# frame states
+_KEY_OR_END = 0
+_KEY = 1
+_COLON = 2
+_VALUE_OR_END = 3
+_VALUE = 4
+_COMMA_OR_END = 5
+
+
+class _Frame:
+    __slots__ = ("path", "is_object", "state", "key", "index")
+
+    def __init__(self, path: Path, is_object: bool):
+        self.path = path
+        self.is_object = is_object
+        self.state = _KEY_OR_END if is_object else _VALUE_OR_END
+        self.key: str | None = None
+        self.index = 0
+
+    def child_path(self) -> Path:
+        return self.path + ((self.key,) if self.is_object else (self.index,))
+
+
+class _Capture:
+    __slots__ = ("path", "kind", "parts", "size", "attempt_at", "depth", "in_string", "escape")
+
+    def __init__(self, path: Path, kind: str, buffered: bool):
+        self.path = path
+        self.kind = kind  # "container", "string", "scalar" or "key"
+        self.parts: list[str] | None = [] if buffered else None
+        self.size = 0
+        self.attempt_at = 0
+        self.depth = 0
+        self.in_string = kind in ("string", "key")
+        self.escape = False
+
+
+class StreamingJSONParser:
+    def __init__(self, descend: Callable[[Path], bool], skip: Callable[[Path], bool] | None = None):
+        self._descend = descend
+        self._skip = skip or (lambda path: False)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._stack: list[_Frame] = []
+        self._capture: _Capture | None = None
+        self._started = False
+        self._done = False
+        self._pushback = ""
+        self._json = json.JSONDecoder()
+
+    def feed(self, data: bytes | str) -> list[tuple[Path, Any]]:
+        """Consume the next chunk, returning the sections completed by it"""
+        text = self._decoder.decode(data) if isinstance(data, bytes) else data
+        events: list[tuple[Path, Any]] = []
+        while text:
+            self._pushback = ""
+            self._process(text, events)
+            # a section that was decoded late may leave already-buffered text to re-read
+            text = self._pushback
+        return events
+
+    def _process(self, text: str, events: list) -> None:
+        i = 0
+        n = len(text)
+        while i < n:
+            if self._capture is not None:
+                i = self._continue_capture(text, i, events)
+                continue
+            c = text[i]
+            if c in _WHITESPACE:
+                i += 1
+                continue
+            if not self._stack:
+                if self._started:
+                    raise ValueError(f"Unexpected data after the JSON document: {c!r}")
+                self._started = True
+                i = self._start_value((), text, i)
+                continue
+            frame = self._stack[-1]
+            state = frame.state
+            if state in (_KEY_OR_END, _KEY):
+                if c == "}" and state == _KEY_OR_END:
+                    self._close_container()
+                    i += 1
+                elif c == '"':
+                    self._capture = _Capture(frame.path, "key", True)
+                    self._capture.parts.append('"')  # type: ignore[union-attr]
+                    i += 1
+                else:
+                    raise ValueError(f"Expected an object key at {frame.path}, got {c!r}")
+            elif state == _COLON:
+                if c != ":":
+                    raise ValueError(f"Expected ':' at {frame.path}, got {c!r}")
+                frame.state = _VALUE
+                i += 1
+            elif state in (_VALUE_OR_END, _VALUE):
+                if c == "]" and state == _VALUE_OR_END:
+                    self._close_container()
+                    i += 1
+                else:
+                    i = self._start_value(frame.child_path(), text, i)
+            else:
+                if c == ",":
+                    if frame.is_object:
+                        frame.state = _KEY
+                    else:
+                        frame.state = _VALUE
+                        frame.index += 1
+                elif c == ("}" if frame.is_object else "]"):
+                    self._close_container()
+                else:
+                    raise ValueError(f"Expected ',' or the end of {frame.path}, got {c!r}")
+                i += 1
+
+    def close(self) -> list[tuple[Path, Any]]:
+        """Signal the end of input, flushing a trailing top-level scalar"""
+        events: list[tuple[Path, Any]] = []
+        capture = self._capture
+        if capture is not None and capture.kind == "scalar" and not self._stack:
+            self._finish(capture, events)
+        elif capture is not None and capture.kind == "container" and capture.parts:
+            # decoding attempts may have been postponed, the last one also reports syntax errors
+            joined = "".join(capture.parts)
+            value, end = self._json.raw_decode(joined)
+            self._emit(capture, value, events)
+            events.extend(self.feed(joined[end:]))
+        if self._capture is not None or self._stack or not self._done:
+            raise ValueError("Incomplete JSON document")
+        return events
+
+    def _start_value(self, path: Path, text: str, i: int) -> int:
+        c = text[i]
+        if c in "{[" and self._descend(path):
+            self._stack.append(_Frame(path, c == "{"))
+            return i + 1
+        if c in "{[":
+            kind = "container"
+        elif c == '"':
+            kind = "string"
+        else:
+            kind = "scalar"
+        self._capture = _Capture(path, kind, not self._skip(path))
+        if kind == "string":
+            # opening quote is consumed here, the capture looks for the closing one
+            if self._capture.parts is not None:
+                self._capture.parts.append('"')
+            return i + 1
+        return i
+
+    def _continue_capture(self, text: str, i: int, events: list) -> int:
+        capture = self._capture
+        assert capture is not None
+        start = i
+        n = len(text)
+        if capture.kind == "scalar":
+            match = _SCALAR_END.search(text, i)
+            end = n if match is None else match.start()
+            if capture.parts is not None:
+                capture.parts.append(text[start:end])
+            if match is not None:
+                self._finish(capture, events)
+            return end
+        if capture.kind == "container" and capture.parts is not None:
+            return self._decode_container(capture, text, i, events)
+        if capture.escape:
+            capture.escape = False
+            i += 1
+        if capture.in_string and i < n:
+            i = self._string_rest(capture, text, i)
+        if capture.kind == "container" and not capture.in_string:
+            for match in _TOKEN.finditer(text, i):
+                i = match.end()
+                c = match.group()
+                if c[0] == '"':
+                    if match.group(1) is None:
+                        # string continues in the next chunk
+                        capture.in_string = True
+                        capture.escape = match.group(2) is not None
+                elif c in "{[":
+                    capture.depth += 1
+                else:
+                    capture.depth -= 1
+                    if capture.depth == 0:
+                        break
+            else:
+                i = n
+        if capture.parts is not None:
+            capture.parts.append(text[start:i])
+        if not capture.in_string and (capture.kind != "container" or capture.depth == 0):
+            self._finish(capture, events)
+        return i
+
+    def _decode_container(self, capture: _Capture, text: str, i: int, events: list) -> int:
+        """
+        Kept containers are decoded by the C json scanner, which also finds where they end
+
+        A failed attempt means the container is incomplete, the next attempt waits until
+        the buffered text has doubled so large sections are not re-parsed per chunk.
+        """
+        assert capture.parts is not None
+        n = len(text)
+        if not capture.parts:
+            try:
+                value, end = self._json.raw_decode(text, i)
+            except json.JSONDecodeError:
+                capture.parts.append(text[i:])
+                capture.size = capture.attempt_at = n - i
+                return n
+            self._emit(capture, value, events)
+            return end
+        buffered = capture.size
+        capture.parts.append(text[i:])
+        capture.size += n - i
+        if capture.size < capture.attempt_at * 2:
+            return n
+        joined = "".join(capture.parts)
+        try:
+            value, end = self._json.raw_decode(joined)
+        except json.JSONDecodeError:
+            capture.parts = [joined]
+            capture.attempt_at = capture.size
+            return n
+        self._emit(capture, value, events)
+        if end >= buffered:
+            return i + end - buffered
+        self._pushback = joined[end:]
+        return n
+
+    @staticmethod
+    def _string_rest(capture: _Capture, text: str, i: int) -> int:
+        match = _STRING_REST.match(text, i)
+        assert match is not None
+        if match.group(1) is not None:
+            capture.in_string = False
+        else:
+            capture.escape = match.group(2) is not None
+        return match.end()
+
+    def _finish(self, capture: _Capture, events: list) -> None:
+        value = None if capture.parts is None else json.loads("".join(capture.parts))
+        if capture.kind == "key":
+            self._capture = None
+            frame = self._stack[-1]
+            frame.key = value
+            frame.state = _COLON
+            return
+        self._emit(capture, value, events)
+
+    def _emit(self, capture: _Capture, value, events: list) -> None:
+        self._capture = None
+        if capture.parts is not None:
+            events.append((capture.path, value))
+        self._value_done()
+
+    def _close_container(self) -> None:
+        self._stack.pop()
+        self._value_done()
+
+    def _value_done(self) -> None:
+        if self._stack:
+            self._stack[-1].state = _COMMA_OR_END
+        else:
+            self._done = True
+
+
+def iter_sections(
+    chunks: Iterable[bytes | str], descend: Callable[[Path], bool], skip: Callable[[Path], bool] | None = None
+) -> Iterator[tuple[Path, Any]]:
+    parser = StreamingJSONParser(descend, skip)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
@@ -0,0 +1,40 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._equity import EquityMetrics, EquityPanel, analyze, equity_series
+    from ._rolling import RollingWindowTable
+    from ._statistics import StatisticsMatrix, parse_statistic
+    from ._trades import reconstruct_trades
+
+# _equity needs numpy, only importing it when used keeps the rest available without it
+_LAZY = {
+    "EquityMetrics": "._equity",
+    "EquityPanel": "._equity",
+    "analyze": "._equity",
+    "equity_series": "._equity",
+    "RollingWindowTable": "._rolling",
+    "StatisticsMatrix": "._statistics",
+    "parse_statistic": "._statistics",
+    "reconstruct_trades": "._trades",
+}
+
+__all__ = [
+    "EquityMetrics",
+    "EquityPanel",
+    "RollingWindowTable",
+    "StatisticsMatrix",
+    "analyze",
+    "equity_series",
+    "parse_statistic",
+    "reconstruct_trades",
+]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
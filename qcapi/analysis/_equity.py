@@ -0,0 +1,237 @@
+"""
+Vectorized analytics over equity curves of many backtests
+
+Series are aligned onto a shared time grid (forward filled, NaN before a series
+starts) and every metric is computed column-wise with numpy. Per-column metrics are
+split across a process pool once there are enough columns to amortize the workers.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Iterable, Mapping, Sequence
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError("qcapi.analysis equity analytics require numpy: pip install gcapi[analysis]") from e
+
+if TYPE_CHECKING:
+    from .._client import QCClient
+    from ..models import ChartSeries
+
+DAY = 86_400
+YEAR = 365.25 * DAY
+
+
+class EquityPanel:
+    """Equity values of several series on a common time grid, shape (len(grid), len(names))"""
+
+    def __init__(self, names: list[str], grid: "np.ndarray", values: "np.ndarray", step: float | None = None):
+        self.names = names
+        self.grid = grid
+        self.values = values
+        if step is None:
+            step = float(np.median(np.diff(grid))) if len(grid) > 1 else DAY
+        self.step = step
+
+    @property
+    def periods_per_year(self) -> float:
+        """Grid steps per calendar year, the grid covers every day including weekends"""
+        return YEAR / self.step
+
+    @classmethod
+    def align(
+        cls,
+        series: Mapping[str, "ChartSeries | tuple[Sequence[float], Sequence[float]]"],
+        step: float = DAY,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> "EquityPanel":
+        """
+        Align series onto a grid of `step` seconds
+
+        series: name -> ChartSeries (the last column is used, i.e. close for candles)
+            or a (times, values) pair
+        """
+        names = list(series)
+        columns = [_time_value(s) for s in series.values()]
+        if start is None:
+            start = min(times[0] for times, _ in columns if len(times))
+        if end is None:
+            end = max(times[-1] for times, _ in columns if len(times))
+        grid = np.arange(start, end + step, step, dtype=float)
+        values = np.full((len(grid), len(names)), np.nan)
+        for i, (times, column) in enumerate(columns):
+            if not len(times):
+                continue
+            order = np.argsort(times, kind="stable")
+            times = times[order]
+            column = column[order]
+            position = np.searchsorted(times, grid, side="right") - 1
+            valid = position >= 0
+            values[valid, i] = column[position[valid]]
+            values[grid > times[-1], i] = np.nan
+        return cls(names, grid, values, step)
+
+    def returns(self) -> "np.ndarray":
+        returns = np.full_like(self.values, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns[1:] = self.values[1:] / self.values[:-1] - 1.0
+        return returns
+
+    def drawdown(self) -> "np.ndarray":
+        return drawdown(self.values)
+
+    def correlation(self) -> "np.ndarray":
+        return correlation(self.returns())
+
+    def analyze(
+        self, window: int = 63, periods_per_year: float | None = None, processes: int | None = None
+    ) -> "EquityMetrics":
+        return analyze(self, window, periods_per_year, processes=processes)
+
+
+class EquityMetrics:
+    """Result of `analyze`, per-column arrays share the panel's grid and column order"""
+
+    def __init__(self, panel: EquityPanel, drawdown, max_drawdown, rolling_volatility, rolling_sharpe, correlation):
+        self.names = panel.names
+        self.grid = panel.grid
+        self.drawdown = drawdown
+        self.max_drawdown = max_drawdown
+        self.rolling_volatility = rolling_volatility
+        self.rolling_sharpe = rolling_sharpe
+        self.correlation = correlation
+
+
+def _time_value(series) -> tuple["np.ndarray", "np.ndarray"]:
+    if isinstance(series, tuple):
+        times, values = series
+    else:
+        columns = series.to_columns()
+        times = columns["time"]
+        values = columns[series.column_names()[-1]]
+    return np.asarray(times, dtype=float), np.asarray(values, dtype=float)
+
+
+def drawdown(values: "np.ndarray") -> "np.ndarray":
+    """Fractional distance below the running peak (0 at a new high, negative otherwise)"""
+    peak = np.fmax.accumulate(values, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return values / peak - 1.0
+
+
+def _rolling_mean_std(x: "np.ndarray", window: int) -> tuple["np.ndarray", "np.ndarray"]:
+    valid = ~np.isnan(x)
+    filled = np.where(valid, x, 0.0)
+    zeros = np.zeros((1, x.shape[1]))
+    total = np.concatenate([zeros, np.cumsum(filled, axis=0)])
+    squares = np.concatenate([zeros, np.cumsum(filled * filled, axis=0)])
+    counts = np.concatenate([zeros, np.cumsum(valid, axis=0)])
+    mean = np.full_like(x, np.nan)
+    std = np.full_like(x, np.nan)
+    if len(x) < window:
+        return mean, std
+    n = counts[window:] - counts[:-window]
+    s = total[window:] - total[:-window]
+    ss = squares[window:] - squares[:-window]
+    full = n == window
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m = s / window
+        variance = np.maximum(ss / window - m * m, 0.0) * window / (window - 1)
+    mean[window - 1 :] = np.where(full, m, np.nan)
+    std[window - 1 :] = np.where(full, np.sqrt(variance), np.nan)
+    return mean, std
+
+
+def rolling_volatility(returns: "np.ndarray", window: int, periods_per_year: float = 252) -> "np.ndarray":
+    _, std = _rolling_mean_std(returns, window)
+    return std * np.sqrt(periods_per_year)
+
+
+def rolling_sharpe(
+    returns: "np.ndarray", window: int, periods_per_year: float = 252, risk_free: float = 0.0
+) -> "np.ndarray":
+    """Annualized rolling Sharpe, `risk_free` is an annual rate"""
+    excess = returns - risk_free / periods_per_year
+    mean, std = _rolling_mean_std(excess, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return mean / std * np.sqrt(periods_per_year)
+
+
+def correlation(returns: "np.ndarray") -> "np.ndarray":
+    """Pairwise correlation using only the rows where both columns have a value"""
+    valid = (~np.isnan(returns)).astype(float)
+    x = np.where(valid > 0, returns, 0.0)
+    n = valid.T @ valid
+    sum_x = x.T @ valid  # [i, j]: sum of column i where j is also valid
+    sum_xx = (x * x).T @ valid
+    sum_xy = x.T @ x
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_i = sum_x / n
+        mean_j = sum_x.T / n
+        covariance = sum_xy / n - mean_i * mean_j
+        variance_i = sum_xx / n - mean_i**2
+        variance_j = sum_xx.T / n - mean_j**2
+        return covariance / np.sqrt(variance_i * variance_j)
+
+
+def _column_metrics(values: "np.ndarray", window: int, periods_per_year: float):
+    returns = np.full_like(values, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns[1:] = values[1:] / values[:-1] - 1.0
+    dd = drawdown(values)
+    return (
+        dd,
+        np.nanmin(np.where(np.isnan(dd), 0.0, dd), axis=0),
+        rolling_volatility(returns, window, periods_per_year),
+        rolling_sharpe(returns, window, periods_per_year),
+    )
+
+
+def analyze(
+    panel: EquityPanel,
+    window: int = 63,
+    periods_per_year: float | None = None,
+    *,
+    processes: int | None = None,
+    chunk_size: int = 64,
+) -> EquityMetrics:
+    """
+    Drawdowns, rolling volatility/Sharpe and the correlation matrix for every column
+
+    periods_per_year: annualization factor, defaults to the panel's `periods_per_year`
+        (365.25 for a daily grid, forward-filled weekends are zero-return periods)
+    processes: worker processes for the per-column metrics, 1 disables the pool.
+        The pool is only used when there is more than one chunk of `chunk_size` columns
+    """
+    if periods_per_year is None:
+        periods_per_year = panel.periods_per_year
+    values = panel.values
+    chunks = [values[:, i : i + chunk_size] for i in range(0, values.shape[1], chunk_size)] or [values]
+    if processes == 1 or len(chunks) == 1:
+        results = [_column_metrics(chunk, window, periods_per_year) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [pool.submit(_column_metrics, chunk, window, periods_per_year) for chunk in chunks]
+            results = [future.result() for future in futures]
+    dd, max_dd, volatility, sharpe = (np.concatenate(parts, axis=-1) for parts in zip(*results))
+    return EquityMetrics(panel, dd, max_dd, volatility, sharpe, panel.correlation())
+
+
+def equity_series(
+    client: "QCClient",
+    project_id,
+    backtest_ids: Iterable[str],
+    chart: str = "Strategy Equity",
+    series: str = "Equity",
+    count: int = 50_000,
+) -> dict[str, "ChartSeries"]:
+    """Fetch one chart series per backtest, keyed by backtest id, skipping backtests without it"""
+    result = {}
+    for backtest_id in backtest_ids:
+        response = client.backtests.chart.read(project_id, backtest_id, chart, count)
+        if response.chart is not None and series in response.chart.series:
+            result[backtest_id] = response.chart.series[series]
+    return result
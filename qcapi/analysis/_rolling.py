@@ -0,0 +1,150 @@
+"""
+Columnar view of `rollingWindow`: one row per window, one float column per statistic
+"""
+
+from __future__ import annotations
+
+from array import array
+from datetime import date
+from typing import Any, Iterable, Iterator, Mapping
+
+from ..models._backtest_models import BacktestResponse, BacktestResult, PortfolioStatistics, TradeStatistics
+from ._statistics import NAN, parse_statistic
+
+
+def _numeric_fields(model, prefix: str) -> list[tuple[str, str]]:
+    return [
+        (field.alias or name, f"{prefix}.{name}")
+        for name, field in model.model_fields.items()
+        if field.annotation in (int, float)
+    ]
+
+
+# section of AlgorithmPerformance -> [(json key, column)]
+_SECTIONS = {
+    "tradeStatistics": _numeric_fields(TradeStatistics, "trade"),
+    "portfolioStatistics": _numeric_fields(PortfolioStatistics, "portfolio"),
+}
+COLUMNS = [column for fields in _SECTIONS.values() for _, column in fields]
+
+
+def parse_window_label(label: str) -> tuple[str, date]:
+    """'M3_20230331' -> ('M3', date(2023, 3, 31))"""
+    period, _, end = label.rpartition("_")
+    return period, date(int(end[:4]), int(end[4:6]), int(end[6:8]))
+
+
+def _period_key(period: str):
+    # "M1" < "M3" < "M12", unknown labels sort by text
+    digits = period[1:]
+    return (period[:1], int(digits) if digits.isdigit() else 0, period)
+
+
+def _number(value) -> float:
+    if value is None:
+        return NAN
+    if isinstance(value, (int, float)):
+        return float(value)
+    return parse_statistic(str(value))[0]
+
+
+class RollingWindowTable:
+    """
+    Rolling window statistics as float columns, rows sorted by (period, window end)
+
+    Columns are the numeric TradeStatistics/PortfolioStatistics fields, prefixed with
+    "trade." and "portfolio." (e.g. "portfolio.sharpe_ratio").
+    """
+
+    def __init__(self, periods: list[str], end_dates: list[date], columns: dict[str, array]):
+        self.periods = periods
+        self.end_dates = end_dates
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.periods)
+
+    @property
+    def period_names(self) -> list[str]:
+        return sorted(set(self.periods), key=_period_key)
+
+    def column(self, name: str, period: str | None = None) -> array:
+        values = self.columns[name]
+        if period is None:
+            return values
+        return array("d", (value for value, row_period in zip(values, self.periods) if row_period == period))
+
+    def period(self, period: str) -> "RollingWindowTable":
+        """The rows of one window length, e.g. "M12", ordered by window end"""
+        rows = [i for i, row_period in enumerate(self.periods) if row_period == period]
+        return self._take(rows)
+
+    def to_records(self) -> list[dict[str, Any]]:
+        names = list(self.columns)
+        return [
+            dict(period=period, end=end, **{name: self.columns[name][i] for name in names})
+            for i, (period, end) in enumerate(zip(self.periods, self.end_dates))
+        ]
+
+    def to_numpy(self):
+        """(windows, statistics) float array in `columns` order"""
+        import numpy as np
+
+        return np.column_stack([np.frombuffer(column, dtype=float) for column in self.columns.values()])
+
+    def _take(self, rows: list[int]) -> "RollingWindowTable":
+        return RollingWindowTable(
+            [self.periods[i] for i in rows],
+            [self.end_dates[i] for i in rows],
+            {name: array("d", (values[i] for i in rows)) for name, values in self.columns.items()},
+        )
+
+    @classmethod
+    def from_windows(cls, windows: Iterable[tuple[str, Mapping[str, Any]]]) -> "RollingWindowTable":
+        """
+        Build the table in one pass over `(label, raw AlgorithmPerformance JSON)` pairs
+
+        Pairs can come from `rollingWindow.items()` or from the rolling window sections
+        of `Backtests.read_stream`, without validating any models.
+        """
+        periods: list[str] = []
+        end_dates: list[date] = []
+        columns = {name: array("d") for name in COLUMNS}
+        for label, window in windows:
+            period, end = parse_window_label(label)
+            periods.append(period)
+            end_dates.append(end)
+            for section, fields in _SECTIONS.items():
+                statistics = window.get(section) or {}
+                for key, column in fields:
+                    columns[column].append(_number(statistics.get(key)))
+        table = cls(periods, end_dates, columns)
+        order = sorted(range(len(periods)), key=lambda i: (_period_key(periods[i]), end_dates[i]))
+        if order != list(range(len(periods))):
+            table = table._take(order)
+        return table
+
+    @classmethod
+    def from_backtest(cls, backtest: BacktestResponse | BacktestResult | Mapping[str, Any]) -> "RollingWindowTable":
+        """From a backtest response/result or the raw JSON of either"""
+        if isinstance(backtest, BacktestResponse):
+            backtest = backtest.backtest
+        if isinstance(backtest, BacktestResult):
+            windows = {
+                label: performance.model_dump(by_alias=True)
+                for label, performance in (backtest.rolling_window or {}).items()
+            }
+        else:
+            windows = backtest.get("backtest", backtest).get("rollingWindow") or {}
+        return cls.from_windows(windows.items())
+
+    @classmethod
+    def from_stream(cls, sections: Iterable[tuple[tuple, Any]]) -> "RollingWindowTable":
+        """From the `(path, value)` sections of `Backtests.read_stream`, other sections are ignored"""
+        return cls.from_windows(_stream_windows(sections))
+
+
+def _stream_windows(sections: Iterable[tuple[tuple, Any]]) -> Iterator[tuple[str, Mapping[str, Any]]]:
+    for path, value in sections:
+        if len(path) == 3 and path[:2] == ("backtest", "rollingWindow"):
+            yield path[2], value
@@ -0,0 +1,146 @@
+"""
+Numeric conversion of the string statistics QC returns ("12.3%", "$1,234.56", "0.8")
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Iterable, Mapping
+
+from ..models._backtest_models import BacktestResponse, BacktestResult, RuntimeStatistics, StatisticsResult
+
+NAN = float("nan")
+_CURRENCY_SYMBOLS = "$€£¥₹"
+_MAGNITUDES = {"K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+
+
+@lru_cache(maxsize=1 << 16)
+def parse_statistic(text: str | None) -> tuple[float, str]:
+    """
+    Parse a QC statistic string into (value, unit)
+
+    Percentages are returned as fractions with unit "%", currency values have their
+    symbol as the unit and "K"/"M"/"B"/"T" suffixes are expanded. Values that are not
+    numeric (e.g. "Lowest Capacity Asset") return NaN.
+    """
+    if text is None:
+        return NAN, ""
+    value = text.strip().replace(",", "")
+    unit = ""
+    scale = 1.0
+    if value.endswith("%"):
+        unit = "%"
+        scale = 0.01
+        value = value[:-1]
+    sign = ""
+    if value[:1] in "+-":
+        sign, value = value[:1], value[1:]
+    if value[:1] and value[:1] in _CURRENCY_SYMBOLS:
+        unit = value[:1]
+        value = value[1:]
+    if value[-1:].upper() in _MAGNITUDES:
+        scale *= _MAGNITUDES[value[-1:].upper()]
+        value = value[:-1]
+    try:
+        return float(sign + value) * scale, unit
+    except ValueError:
+        return NAN, ""
+
+
+def _aliases(model) -> list[tuple[str, str]]:
+    return [(field.alias or name, name) for name, field in model.model_fields.items()]
+
+
+_STATISTICS_FIELDS = _aliases(StatisticsResult)
+_RUNTIME_FIELDS = _aliases(RuntimeStatistics)
+
+
+class StatisticsMatrix:
+    """Backtests x metrics table of floats, one row per backtest"""
+
+    def __init__(self, index: list[str], columns: list[str], rows: list[list[float]], units: dict[str, str]):
+        self.index = index
+        self.columns = columns
+        self.rows = rows
+        self.units = units
+        self._positions = {name: i for i, name in enumerate(columns)}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def column(self, name: str) -> list[float]:
+        position = self._positions[name]
+        return [row[position] for row in self.rows]
+
+    def rank(self, name: str, descending: bool = True) -> list[str]:
+        """Backtest ids ordered by a metric, NaN values last"""
+        position = self._positions[name]
+
+        def key(i):
+            value = self.rows[i][position]
+            if value != value:
+                return (1, 0.0)
+            return (0, -value if descending else value)
+
+        return [self.index[i] for i in sorted(range(len(self.rows)), key=key)]
+
+    def to_records(self) -> list[dict[str, Any]]:
+        return [dict(backtestId=bt_id, **dict(zip(self.columns, row))) for bt_id, row in zip(self.index, self.rows)]
+
+    def to_numpy(self):
+        import numpy as np
+
+        return np.array(self.rows, dtype=float).reshape(len(self.rows), len(self.columns))
+
+    @classmethod
+    def from_backtests(
+        cls,
+        backtests: Iterable[BacktestResponse | BacktestResult | Mapping[str, Any]],
+        *,
+        runtime: bool = True,
+        parameters: bool = True,
+    ) -> "StatisticsMatrix":
+        """
+        Build the matrix from backtest responses/results, or the raw JSON of either
+
+        Statistic columns use the StatisticsResult field names, runtime statistics are
+        prefixed with "runtime." and parameterSet entries with "parameter."
+        """
+        records = [_raw_backtest(bt) for bt in backtests]
+        fields = [(("statistics", alias), name) for alias, name in _STATISTICS_FIELDS]
+        if runtime:
+            fields += [(("runtimeStatistics", alias), f"runtime.{name}") for alias, name in _RUNTIME_FIELDS]
+        if parameters:
+            parameter_names = sorted({name for record in records for name in (record.get("parameterSet") or {})})
+            fields += [(("parameterSet", name), f"parameter.{name}") for name in parameter_names]
+
+        columns = [column for _, column in fields]
+        units: dict[str, str] = {}
+        column_values = []
+        for (section, key), column in fields:
+            values = []
+            for record in records:
+                raw = (record.get(section) or {}).get(key)
+                value, unit = parse_statistic(raw if raw is None else str(raw))
+                if unit and column not in units:
+                    units[column] = unit
+                values.append(value)
+            column_values.append(values)
+        rows = [list(row) for row in zip(*column_values)] if column_values else [[] for _ in records]
+        index = [record.get("backtestId", "") for record in records]
+        return cls(index, columns, rows, units)
+
+
+def _raw_backtest(backtest) -> Mapping[str, Any]:
+    if isinstance(backtest, BacktestResponse):
+        backtest = backtest.backtest
+    if isinstance(backtest, BacktestResult):
+        return dict(
+            backtestId=backtest.backtest_id,
+            statistics=backtest.statistics.model_dump(by_alias=True),
+            runtimeStatistics=backtest.runtime_statistics.model_dump(by_alias=True),
+            parameterSet=backtest.parameter_set,
+        )
+    if "backtest" in backtest:
+        return backtest["backtest"]
+    return backtest
@@ -0,0 +1,105 @@
+"""
+Round-trip trades from order fill events, for live deployments that do not report closedTrades
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from datetime import datetime, timezone
+from typing import Iterable, Literal, Mapping
+
+from ..models._backtest_models import Symbol, Trade
+from ..models._orders import Order, OrderEventStatus
+
+_FILL_STATUSES = (OrderEventStatus.FILLED, OrderEventStatus.PARTIALLY_FILLED)
+LONG = 0
+SHORT = 1
+
+
+def format_duration(seconds: float) -> str:
+    """Format like the C# TimeSpan strings QC uses for Trade.duration ("1.02:03:04")"""
+    days, remainder = divmod(int(round(seconds)), 86_400)
+    hours, remainder = divmod(remainder, 3_600)
+    minutes, secs = divmod(remainder, 60)
+    clock = f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return f"{days}.{clock}" if days else clock
+
+
+def reconstruct_trades(
+    orders: Iterable[Order],
+    method: Literal["fifo", "lifo"] = "fifo",
+    multipliers: Mapping[str, float] | None = None,
+) -> list[Trade]:
+    """
+    Match fills into closed round-trip trades, in the shape of backtest `closedTrades`
+
+    Fills are processed in time order in a single pass. A fill that reverses a position
+    closes the open lots (oldest first for "fifo", newest first for "lifo") and the rest
+    opens a new lot. Fees of a fill are split pro rata over the quantity they cover.
+
+    multipliers: contract multiplier per symbol id (e.g. 100 for equity options), default 1
+    Excursion fields (mae, mfe, end_trade_drawdown) need price history and are left at 0.
+    """
+    if method not in ("fifo", "lifo"):
+        raise ValueError(f"Unknown matching method {method}")
+    multipliers = multipliers or {}
+    symbols: dict[str, Symbol] = {}
+    fills = []
+    for order in orders:
+        symbol_id = order.symbol.id
+        if symbol_id not in symbols:
+            symbols[symbol_id] = Symbol.model_construct(
+                value=order.symbol.value, id=symbol_id, permtick=order.symbol.permtick
+            )
+        for event in order.events:
+            if event.status not in _FILL_STATUSES or not event.fillQuantity:
+                continue
+            quantity = event.fillQuantity
+            if event.direction == "sell" and quantity > 0:
+                quantity = -quantity
+            fee = abs(event.orderFeeAmount or 0.0)
+            fills.append((event.time, event.orderEventId, symbol_id, quantity, event.fillPrice, fee))
+    fills.sort(key=lambda fill: (fill[0], fill[1]))
+
+    # symbol id -> deque of [signed open quantity, price, time, fee per unit]
+    lots: dict[str, deque] = {}
+    trades = []
+    from_end = method == "lifo"
+    for fill_time, _, symbol_id, quantity, price, fee in fills:
+        book = lots.setdefault(symbol_id, deque())
+        fee_per_unit = fee / abs(quantity)
+        multiplier = multipliers.get(symbol_id, 1.0)
+        while quantity and book and (book[-1 if from_end else 0][0] > 0) != (quantity > 0):
+            lot = book[-1] if from_end else book[0]
+            lot_quantity, entry_price, entry_time, entry_fee = lot
+            # fractional fills leave float remainders such as 1e-17, equal sizes close each other exactly
+            closes = math.isclose(abs(quantity), abs(lot_quantity))
+            matched = abs(lot_quantity) if closes else min(abs(quantity), abs(lot_quantity))
+            direction = LONG if lot_quantity > 0 else SHORT
+            sign = 1.0 if direction == LONG else -1.0
+            trades.append(
+                Trade.model_construct(
+                    symbol=symbols[symbol_id],
+                    entry_time=datetime.fromtimestamp(entry_time, tz=timezone.utc),
+                    entry_price=entry_price,
+                    direction=direction,
+                    quantity=matched,
+                    exit_time=datetime.fromtimestamp(fill_time, tz=timezone.utc),
+                    exit_price=price,
+                    profit_loss=(price - entry_price) * matched * sign * multiplier,
+                    total_fees=(entry_fee + fee_per_unit) * matched,
+                    mae=0.0,
+                    mfe=0.0,
+                    duration=format_duration(fill_time - entry_time),
+                    end_trade_drawdown=0.0,
+                )
+            )
+            if matched == abs(lot_quantity):
+                book.pop() if from_end else book.popleft()
+            else:
+                lot[0] = lot_quantity - matched * sign
+            quantity = 0.0 if closes else quantity + matched * sign
+        if quantity:
+            book.append([quantity, price, fill_time, fee_per_unit])
+    return trades
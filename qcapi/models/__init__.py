@@ -1,7 +1,25 @@
-from ._backtests import BacktestSummaryResponse, BacktestSummaryResult
-from ._backtest_models import BacktestResponse, BacktestStatus
-from ._orders import Order, OrderStatus
-from ._chart import ChartSeriesTypeEnum, ChartTypeEnum, Chart, ChartSeries
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._backtests import BacktestSummaryResponse, BacktestSummaryResult
+    from ._backtest_models import BacktestResponse, BacktestStatus
+    from ._orders import Order, OrderStatus
+    from ._chart import ChartSeriesTypeEnum, ChartTypeEnum, Chart, ChartSeries
+
+# model modules are only imported (and their models built) when first accessed
+_LAZY = {
+    "BacktestSummaryResponse": "._backtests",
+    "BacktestSummaryResult": "._backtests",
+    "BacktestResponse": "._backtest_models",
+    "BacktestStatus": "._backtest_models",
+    "Order": "._orders",
+    "OrderStatus": "._orders",
+    "ChartSeriesTypeEnum": "._chart",
+    "ChartTypeEnum": "._chart",
+    "Chart": "._chart",
+    "ChartSeries": "._chart",
+}
 
 __all__ = [
     "BacktestSummaryResponse",
@@ -15,3 +33,16 @@ __all__ = [
     "ChartSeries",
     "BacktestStatus"
 ]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
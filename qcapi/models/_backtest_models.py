@@ -1,13 +1,15 @@
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import Field, ConfigDict
 from enum import Enum
 
+from ._base import QCModel
+
 
 # ============== REQUEST MODELS ==============
 
 
-class CreateBacktestRequest(BaseModel):
+class CreateBacktestRequest(QCModel):
     """Request to create a new backtest."""
 
     model_config = ConfigDict(validate_by_name=True)
@@ -42,7 +44,7 @@ class TradeDirection(str, Enum):
 # ============== CORE DATA MODELS ==============
 
 
-class Symbol(BaseModel):
+class Symbol(QCModel):
     """Represents a unique security identifier."""
 
     model_config = ConfigDict(validate_by_name=True)
@@ -51,7 +53,7 @@ class Symbol(BaseModel):
     permtick: str = Field(..., description="The current symbol for this ticker")
 
 
-class ResearchGuide(BaseModel):
+class ResearchGuide(QCModel):
     """A power gauge for backtests, time and parameters to estimate the overfitting risk."""
 
     model_config = ConfigDict(validate_by_name=True)
@@ -60,14 +62,14 @@ class ResearchGuide(BaseModel):
     parameters: int = Field(..., description="Number of parameters detected")
 
 
-class ChartSummary(BaseModel):
+class ChartSummary(QCModel):
     """Contains the names of all charts."""
 
     model_config = ConfigDict(validate_by_name=True)
     name: str = Field(..., description="Name of the Chart")
 
 
-class ParameterSet(BaseModel):
+class ParameterSet(QCModel):
     """Parameter set."""
 
     model_config = ConfigDict(validate_by_name=True)
@@ -75,7 +77,7 @@ class ParameterSet(BaseModel):
     value: float = Field(..., description="Value of parameter")
 
 
-class RuntimeStatistics(BaseModel):
+class RuntimeStatistics(QCModel):
     """Runtime banner/updating statistics."""
 
     model_config = ConfigDict(validate_by_name=True)
@@ -91,7 +93,7 @@ class RuntimeStatistics(BaseModel):
     volume: Optional[str] = Field(None, alias="Volume", description="Total transaction volume")
 
 
-class StatisticsResult(BaseModel):
+class StatisticsResult(QCModel):
     """Statistics information sent during the algorithm operations."""
 
     model_config = ConfigDict(validate_by_name=True)
@@ -143,7 +145,7 @@ class StatisticsResult(BaseModel):
     )
 
 
-class TradeStatistics(BaseModel):
+class TradeStatistics(QCModel):
     """A set of statistics calculated from a list of closed trades."""
 
     model_config = ConfigDict(validate_by_name=True)
@@ -269,7 +271,7 @@ class TradeStatistics(BaseModel):
     total_fees: float = Field(..., alias="totalFees", description="The sum of fees for all trades")
 
 
-class PortfolioStatistics(BaseModel):
+class PortfolioStatistics(QCModel):
     """Represents a set of statistics calculated from equity and benchmark samples."""
 
     model_config = ConfigDict(validate_by_name=True)
@@ -321,7 +323,7 @@ class PortfolioStatistics(BaseModel):
     )
 
 
-class Trade(BaseModel):
+class Trade(QCModel):
     """Represents a closed trade."""
 
     model_config = ConfigDict(validate_by_name=True)
@@ -345,7 +347,7 @@ class Trade(BaseModel):
     )
 
 
-class AlgorithmPerformance(BaseModel):
+class AlgorithmPerformance(QCModel):
     """The AlgorithmPerformance class is a wrapper for TradeStatistics and PortfolioStatistics."""
 
     model_config = ConfigDict(validate_by_name=True)
@@ -360,7 +362,7 @@ class AlgorithmPerformance(BaseModel):
     closed_trades: List[Trade] = Field(..., alias="closedTrades", description="The algorithm statistics on portfolio")
 
 
-class BacktestResult(BaseModel):
+class BacktestResult(QCModel):
     """Results object class. Results are exhaust from backtest or live algorithms running in LEAN."""
 
     model_config = ConfigDict(validate_by_name=True)
@@ -410,7 +412,7 @@ class BacktestResult(BaseModel):
 # ============== RESPONSE MODELS ==============
 
 
-class BacktestResponse(BaseModel):
+class BacktestResponse(QCModel):
     """Collection container for a list of backtests for a project."""
 
     model_config = ConfigDict(validate_by_name=True)
@@ -420,7 +422,7 @@ class BacktestResponse(BaseModel):
     errors: Optional[List[str]] = Field(None, description="List of errors with the API call")
 
 
-class UnauthorizedError(BaseModel):
+class UnauthorizedError(QCModel):
     """Unauthorized response from the API."""
 
     model_config = ConfigDict(validate_by_name=True)
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 from typing import Optional
-from pydantic import BaseModel
+
+from ._base import QCModel
 
 # parameter set is just a dict
 ParameterSet = dict | list
 
 
-class BacktestSummaryResult(BaseModel):
+class BacktestSummaryResult(QCModel):
     backtestId: str
     status: str
     note: Optional[str]
@@ -20,23 +21,24 @@ class BacktestSummaryResult(BaseModel):
     tradeableDates: Optional[int]  # was supposed to be a string
     parameterSet: Optional[ParameterSet]
     tags: list[str]
-    sharpeRatio: float
-    alpha: float
-    beta: float
-    compoundingAnnualReturn: float
-    drawdown: float
-    lossRate: float
-    netProfit: float
-    parameters: int
-    psr: float
-    securityTypes: Optional[int]  # was supposed to be a string, but found an int
-    sortinoRatio: Optional[float]
-    trades: int
-    treynorRatio: float
-    winRate: float
+    # statistics are left out when listing with includeStatistics=False
+    sharpeRatio: Optional[float] = None
+    alpha: Optional[float] = None
+    beta: Optional[float] = None
+    compoundingAnnualReturn: Optional[float] = None
+    drawdown: Optional[float] = None
+    lossRate: Optional[float] = None
+    netProfit: Optional[float] = None
+    parameters: Optional[int] = None
+    psr: Optional[float] = None
+    securityTypes: Optional[int] = None  # was supposed to be a string, but found an int
+    sortinoRatio: Optional[float] = None
+    trades: Optional[int] = None
+    treynorRatio: Optional[float] = None
+    winRate: Optional[float] = None
 
 
-class BacktestSummaryResponse(BaseModel):
+class BacktestSummaryResponse(QCModel):
     backtests: list[BacktestSummaryResult]
     count: int
     success: bool
@@ -0,0 +1,12 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class QCModel(BaseModel):
+    """
+    Base for all response models
+
+    Validators are built on first validation instead of at class creation, so
+    importing a module of models that are never used costs very little.
+    """
+
+    model_config = ConfigDict(defer_build=True)
@@ -1,6 +1,9 @@
+from array import array
 from enum import IntEnum
 from typing import Literal
-from pydantic import BaseModel
+from ._base import QCModel
+
+from . import _downsample
 
 class ChartTypeEnum(IntEnum):
     Overlay = 0
@@ -17,14 +20,19 @@ class ChartSeriesTypeEnum(IntEnum):
     Pie = 6
     Treemap = 7
 
-class Chart(BaseModel):
+class Chart(QCModel):
     name: str
     # this is what documentation states, but we seem to get an int instead
     chartType: ChartTypeEnum
     series: dict[str, "ChartSeries"]
 
+    def downsample(self, max_points: int) -> "Chart":
+        """Copy of the chart with every series reduced to at most `max_points` points"""
+        series = {name: s.downsample(max_points) for name, s in self.series.items()}
+        return self.model_copy(update=dict(series=series))
+
 
-class ChartSeries(BaseModel):
+class ChartSeries(QCModel):
     name: str
     unit: str
     """Axis for the chart series."""
@@ -35,3 +43,79 @@ class ChartSeries(BaseModel):
     color: str | None = None
     scatterMarkerSymbol: Literal["none", "circle", "square", "diamond", "triangle", "triangle-down"] | None = None
     """Confirmed this is a string"""
+
+    def column_names(self) -> tuple[str, ...]:
+        """Names of the columns returned by `to_columns`, time is always first."""
+        if self.seriesType == ChartSeriesTypeEnum.Candle:
+            return CANDLE_COLUMNS
+        return POINT_COLUMNS
+
+    def to_columns(self) -> dict[str, array]:
+        """
+        Split `values` into float columns keyed by `column_names`
+
+        Points may be lists (`[time, value]`, `[time, open, high, low, close]`) or
+        dicts (`{"x": time, "y": value}`), missing values become NaN
+        """
+        names = self.column_names()
+        columns = [array("d") for _ in names]
+        for point in self.values:
+            for column, value in zip(columns, point_values(point, len(names))):
+                column.append(value)
+        return dict(zip(names, columns))
+
+    def downsample(self, max_points: int, method: Literal["lttb", "minmax", "ohlc"] | None = None) -> "ChartSeries":
+        """
+        Copy of the series with at most `max_points` points
+
+        method: defaults to "ohlc" for Candle, "lttb" for Line and "minmax" for the
+            other point series; Pie and Treemap series are returned unchanged
+        """
+        if len(self.values) <= max_points or self.seriesType in (ChartSeriesTypeEnum.Pie, ChartSeriesTypeEnum.Treemap):
+            return self
+        if method is None:
+            if self.seriesType == ChartSeriesTypeEnum.Candle:
+                method = "ohlc"
+            elif self.seriesType == ChartSeriesTypeEnum.Line:
+                method = "lttb"
+            else:
+                method = "minmax"
+        columns = self.to_columns()
+        if method == "ohlc":
+            if self.seriesType != ChartSeriesTypeEnum.Candle:
+                raise ValueError("ohlc downsampling requires a Candle series")
+            values = _downsample.resample_ohlc(*columns.values(), max_points)
+        else:
+            if method == "lttb":
+                keep = _downsample.lttb(columns["time"], columns[self.column_names()[-1]], max_points)
+            elif method == "minmax":
+                keep = _downsample.minmax(columns[self.column_names()[-1]], max_points)
+            else:
+                raise ValueError(f"Unknown downsample method {method}")
+            values = [self.values[i] for i in keep]
+        return self.model_copy(update=dict(values=values))
+
+
+POINT_COLUMNS = ("time", "value")
+CANDLE_COLUMNS = ("time", "open", "high", "low", "close")
+_DICT_KEYS = {
+    2: (("x", "time"), ("y", "value")),
+    5: (("x", "time"), ("open", "o"), ("high", "h"), ("low", "l"), ("close", "c")),
+}
+
+
+def point_values(point, width: int) -> tuple[float, ...]:
+    """Normalize a single chart point to a tuple of `width` floats (time first)"""
+    if isinstance(point, dict):
+        values = []
+        for keys in _DICT_KEYS[width]:
+            value = None
+            for key in keys:
+                value = point.get(key)
+                if value is not None:
+                    break
+            values.append(value)
+    else:
+        values = list(point[:width])
+        values.extend([None] * (width - len(values)))
+    return tuple(float("nan") if v is None else float(v) for v in values)
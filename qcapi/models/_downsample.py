@@ -0,0 +1,94 @@
+"""
+Point reduction for large chart series
+
+All functions take parallel column sequences and a point budget and return the
+indices (or for candles the aggregated rows) to keep, so callers can slice the
+original point objects and keep the API's point format.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Sequence
+
+
+def lttb(times: Sequence[float], values: Sequence[float], threshold: int) -> list[int]:
+    """Largest-Triangle-Three-Buckets, keeps the visual shape of a line with `threshold` points"""
+    n = len(times)
+    if threshold >= n:
+        return list(range(n))
+    if threshold < 3:
+        return [0, n - 1][: max(threshold, 0)]
+    selected = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # average of the next bucket is the third triangle point
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        span = next_end - next_start
+        avg_x = sum(times[next_start:next_end]) / span
+        avg_y = sum(values[next_start:next_end]) / span
+
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        ax = times[a]
+        ay = values[a]
+        best = start
+        best_area = -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (values[j] - ay) - (ax - times[j]) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return selected
+
+
+def minmax(values: Sequence[float], threshold: int) -> list[int]:
+    """Keep the minimum and maximum of each bucket (in time order) so extrema survive"""
+    n = len(values)
+    if threshold >= n:
+        return list(range(n))
+    buckets = max(threshold // 2, 1)
+    bucket_size = n / buckets
+    selected = []
+    for i in range(buckets):
+        start = int(i * bucket_size)
+        end = int((i + 1) * bucket_size) if i < buckets - 1 else n
+        if start >= end:
+            continue
+        low = high = start
+        for j in range(start + 1, end):
+            value = values[j]
+            if value < values[low] or math.isnan(values[low]):
+                low = j
+            if value > values[high] or math.isnan(values[high]):
+                high = j
+        selected.extend(sorted({low, high}))
+    return selected
+
+
+def resample_ohlc(
+    times: Sequence[float],
+    opens: Sequence[float],
+    highs: Sequence[float],
+    lows: Sequence[float],
+    closes: Sequence[float],
+    threshold: int,
+) -> list[list[float]]:
+    """Merge consecutive candles into at most `threshold` candles: first open, max high, min low, last close"""
+    n = len(times)
+    if threshold >= n:
+        return [[times[i], opens[i], highs[i], lows[i], closes[i]] for i in range(n)]
+    bucket_size = n / threshold
+    candles = []
+    for i in range(threshold):
+        start = int(i * bucket_size)
+        end = int((i + 1) * bucket_size) if i < threshold - 1 else n
+        if start >= end:
+            continue
+        candles.append([times[start], opens[start], max(highs[start:end]), min(lows[start:end]), closes[end - 1]])
+    return candles
@@ -0,0 +1,64 @@
+"""
+Flyweight sharing for the values repeated across large order histories
+
+Every order carries its own `Symbol` and every event its own copies of the symbol,
+currency and algorithm strings. After decoding, orders are rewritten to share one
+`Symbol` instance per security identifier and interned strings. Shared symbols are
+treated as immutable: assigning to their fields changes every order referencing them.
+"""
+
+from __future__ import annotations
+
+import sys
+from weakref import WeakValueDictionary
+
+from ._orders import Order, Symbol
+
+_ORDER_STRINGS = ("priceCurrency",)
+_EVENT_STRINGS = (
+    "algorithmId",
+    "symbol",
+    "symbolValue",
+    "symbolPermtick",
+    "orderFeeCurrency",
+    "fillPriceCurrency",
+    "direction",
+)
+_intern = sys.intern
+
+# security identifier -> the Symbol all orders share, dropped once no order uses it
+_SYMBOLS: "WeakValueDictionary[str, Symbol]" = WeakValueDictionary()
+
+
+def shared_symbol(symbol: Symbol) -> Symbol:
+    shared = _SYMBOLS.get(symbol.id)
+    if shared is not None and shared.value == symbol.value and shared.permtick == symbol.permtick:
+        return shared
+    values = symbol.__dict__
+    for name in ("value", "id", "permtick"):
+        values[name] = _intern(values[name])
+    _SYMBOLS[symbol.id] = symbol
+    return symbol
+
+
+def intern_orders(orders: list[Order]) -> list[Order]:
+    """Share symbols and intern repeated strings in place, returns `orders`"""
+    for order in orders:
+        # fields are written through __dict__ to skip pydantic's __setattr__
+        values = order.__dict__
+        values["symbol"] = shared_symbol(order.symbol)
+        for name in _ORDER_STRINGS:
+            values[name] = _intern(values[name])
+        for event in order.events:
+            event_values = event.__dict__
+            for name in _EVENT_STRINGS:
+                value = event_values[name]
+                if value is not None:
+                    event_values[name] = _intern(value)
+    return orders
+
+
+def intern_orders_response(response):
+    """Finalizer for responses with an `orders: list[Order]` field"""
+    intern_orders(response.orders)
+    return response
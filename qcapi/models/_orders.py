@@ -2,10 +2,11 @@ from __future__ import annotations
 from typing import Optional, List
 from enum import Enum, IntEnum
 from datetime import datetime
-from pydantic import BaseModel
 
+from ._base import QCModel
 
-class GroupOrderManager(BaseModel):
+
+class GroupOrderManager(QCModel):
     id: int
     quantity: float
     count: int
@@ -14,7 +15,7 @@ class GroupOrderManager(BaseModel):
     direction: int
 
 
-class OrderSubmissionData(BaseModel):
+class OrderSubmissionData(QCModel):
     bidPrice: float
     askPrice: float
     lastPrice: float
@@ -47,7 +48,7 @@ class OrderStatus(IntEnum):
 OrderProperties = dict
 
 
-class OrderEvent(BaseModel):
+class OrderEvent(QCModel):
     algorithmId: str
     symbol: str
     symbolValue: str
@@ -78,13 +79,13 @@ class OrderTypeEnum(Enum):
     STOP_LIMIT = 3
 
 
-class Symbol(BaseModel):
+class Symbol(QCModel):
     value: str
     id: str
     permtick: str
 
 
-class Order(BaseModel):
+class Order(QCModel):
     id: int
     contingentId: Optional[int] = None
     brokerId: List[str]
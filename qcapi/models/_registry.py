@@ -0,0 +1,134 @@
+"""
+Central place responses are turned into models
+
+- `validate` is what the client uses, it picks a registered decoder, the model itself
+  or a cached TypeAdapter for non-model types such as `list[Order]`
+- `decode_json` validates types registered with `enable_json_fast_path` straight from
+  the response bytes, skipping the intermediate python dicts
+- `construct_trusted` rebuilds models from data we stored ourselves (e.g. a
+  `model_dump(by_alias=True)` written to disk) without running validation
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+from datetime import datetime, timezone
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Union, get_args, get_origin, get_type_hints
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+_DECODERS: dict[Any, Callable[[Any], Any]] = {}
+_JSON_DECODERS: dict[Any, Callable[[bytes], Any]] = {}
+_FINALIZERS: dict[Any, Callable[[Any], Any]] = {}
+
+
+@lru_cache(maxsize=None)
+def get_adapter(tp) -> TypeAdapter:
+    """Cached TypeAdapter for `tp`, built the first time it is requested"""
+    return TypeAdapter(tp)
+
+
+def register_decoder(tp, decoder: Callable[[Any], Any]) -> None:
+    """Use `decoder(data)` instead of pydantic validation whenever `tp` is requested"""
+    _DECODERS[tp] = decoder
+
+
+def register_finalizer(tp, finalizer: Callable[[Any], Any]) -> None:
+    """Run `finalizer(result)` on every validated `tp`, whichever path produced it"""
+    _FINALIZERS[tp] = finalizer
+
+
+def _finalize(tp, result):
+    finalizer = _FINALIZERS.get(tp)
+    return result if finalizer is None else finalizer(result)
+
+
+def enable_json_fast_path(tp) -> None:
+    """
+    Validate `tp` directly from the raw JSON body
+
+    pydantic-core then parses the body, datetimes and enums in a single native pass,
+    which is worth it for large, regular payloads such as pages of orders.
+    """
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        _JSON_DECODERS[tp] = tp.model_validate_json
+    else:
+        _JSON_DECODERS[tp] = get_adapter(tp).validate_json
+
+
+def has_json_fast_path(tp) -> bool:
+    return tp in _JSON_DECODERS
+
+
+def decode_json(tp, content: bytes):
+    """
+    Fast path result for `content`, None when the body is not a successful `tp`
+
+    Error and "loading" bodies do not fit the model (or report success false), callers
+    then fall back to the regular dict based handling.
+    """
+    try:
+        result = _JSON_DECODERS[tp](content)
+    except ValidationError:
+        return None
+    if getattr(result, "success", True) is False:
+        return None
+    return _finalize(tp, result)
+
+
+def validate(tp, data):
+    decoder = _DECODERS.get(tp)
+    if decoder is not None:
+        result = decoder(data)
+    elif isinstance(tp, type) and issubclass(tp, BaseModel):
+        result = tp.model_validate(data)
+    else:
+        result = get_adapter(tp).validate_python(data)
+    return _finalize(tp, result)
+
+
+@lru_cache(maxsize=None)
+def _fields(model: type[BaseModel]) -> tuple[tuple[str, str | None, Any], ...]:
+    # resolve string/forward annotations without forcing the (deferred) schema build
+    hints = get_type_hints(model, globalns=vars(sys.modules[model.__module__]))
+    return tuple((name, field.alias, hints.get(name, field.annotation)) for name, field in model.model_fields.items())
+
+
+def construct_trusted(tp, data):
+    """Rebuild `tp` from previously validated data, nested models included, without validation"""
+    if data is None:
+        return None
+    origin = get_origin(tp)
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(tp) if arg is not type(None)]
+        for arg in args:
+            if isinstance(data, dict) and isinstance(arg, type) and issubclass(arg, BaseModel):
+                return construct_trusted(arg, data)
+        return construct_trusted(args[0], data) if len(args) == 1 else data
+    if origin is list:
+        (item_type,) = get_args(tp) or (Any,)
+        return [construct_trusted(item_type, item) for item in data]
+    if origin is dict:
+        _, value_type = get_args(tp) or (Any, Any)
+        return {key: construct_trusted(value_type, value) for key, value in data.items()}
+    if not isinstance(tp, type):
+        return data
+    if issubclass(tp, BaseModel):
+        values = {}
+        for name, alias, annotation in _fields(tp):
+            if alias is not None and alias in data:
+                values[name] = construct_trusted(annotation, data[alias])
+            elif name in data:
+                values[name] = construct_trusted(annotation, data[name])
+        return tp.model_construct(_fields_set=set(values), **values)
+    if issubclass(tp, Enum):
+        return tp(data)
+    if tp is datetime:
+        if isinstance(data, (int, float)):
+            return datetime.fromtimestamp(data, tz=timezone.utc)
+        if isinstance(data, str):
+            return datetime.fromisoformat(data)
+    return data
@@ -1,5 +1,6 @@
 from dotenv import load_dotenv
 from qcapi import QCClient
+import copy
 import os
 import pytest
 
@@ -19,3 +20,59 @@ def project_id():
 @pytest.fixture
 def chart_backtest_id():
     return os.environ["TEST_CHART_BACKTEST_ID"]
+
+
+@pytest.fixture
+def order_payload():
+    return {
+        "id": 1,
+        "brokerId": ["b1"],
+        "symbol": {"value": "SPY", "id": "SPY R735QTJ8XC9X", "permtick": "SPY"},
+        "price": 400.5,
+        "priceCurrency": "USD",
+        "time": "2023-01-03T14:31:00Z",
+        "createdTime": "2023-01-03T14:31:00Z",
+        "lastFillTime": "2023-01-03T14:31:00Z",
+        "quantity": 10.0,
+        "type": 0,
+        "status": 3,
+        "securityType": 1,
+        "direction": 0,
+        "value": 4005.0,
+        "orderSubmissionData": {"bidPrice": 400.4, "askPrice": 400.6, "lastPrice": 400.5},
+        "isMarketable": True,
+        "properties": {"timeInForce": {}},
+        "events": [
+            {
+                "algorithmId": "algo",
+                "symbol": "SPY R735QTJ8XC9X",
+                "symbolValue": "SPY",
+                "symbolPermtick": "SPY",
+                "orderId": 1,
+                "orderEventId": 1,
+                "id": "1-1",
+                "status": "filled",
+                "orderFeeAmount": 1.0,
+                "orderFeeCurrency": "USD",
+                "fillPrice": 400.5,
+                "fillPriceCurrency": "USD",
+                "fillQuantity": 10.0,
+                "direction": "buy",
+                "message": "",
+                "isAssignment": False,
+                "quantity": 10.0,
+                "time": 1672756260.0,
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def order_page(order_payload):
+    """Factory for an orders response body of `count` independent copies of `order_payload`"""
+
+    def page(count=3):
+        orders = [dict(copy.deepcopy(order_payload), id=i) for i in range(count)]
+        return {"orders": orders, "length": count, "success": True}
+
+    return page
@@ -0,0 +1,334 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from qcapi import PruneRule, QCClient, RunLedger
+from qcapi._backtests._sweep import parameter_key
+from qcapi._backtests._wait import ProgressTracker, is_finished, summary_progress
+from qcapi.errors import QCException
+from qcapi.models._backtest_models import (
+    BacktestResponse,
+    BacktestResult,
+    BacktestStatus,
+    RuntimeStatistics,
+    StatisticsResult,
+)
+
+
+def _client(monkeypatch, progress_by_tick):
+    client = QCClient("https://example.invalid", "user", "token")
+    ticks = iter(progress_by_tick)
+    reads = []
+
+    def list_backtests(project_id, include_statistics=True):
+        assert not include_statistics
+        summaries = [
+            SimpleNamespace(backtestId=bt_id, progress=p, status="Completed." if p >= 100 else "In Progress...")
+            for bt_id, p in next(ticks).items()
+        ]
+        return SimpleNamespace(backtests=summaries)
+
+    def read(project_id, backtest_id):
+        reads.append(backtest_id)
+        return SimpleNamespace(backtest=SimpleNamespace(backtest_id=backtest_id))
+
+    monkeypatch.setattr(client.backtests, "list", list_backtests)
+    monkeypatch.setattr(client.backtests, "read", read)
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    return client, reads
+
+
+def test_wait_all_reads_each_backtest_once_when_finished(monkeypatch):
+    client, reads = _client(monkeypatch, [{"a": 20, "b": 100}, {"a": 60, "b": 100}, {"a": 100, "b": 100}])
+    completed = []
+    results = client.backtests.wait_all(1, ["a", "b"], on_complete=completed.append)
+    assert sorted(results) == ["a", "b"]
+    assert reads == ["b", "a"]
+    assert len(completed) == 2
+
+
+def test_wait_all_does_not_finish_at_one_percent(monkeypatch):
+    client, reads = _client(monkeypatch, [{"a": 1}, {"a": 1}, {"a": 100}])
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    assert list(client.backtests.wait_all(1, ["a"])) == ["a"]
+    assert reads == ["a"]
+    # 1 is one percent, the backtest is only read once its status says so
+    assert len(sleeps) == 2
+    assert summary_progress(1) == 0.01
+    assert not is_finished("In Progress...")
+    assert is_finished("Completed.") and is_finished("Runtime Error")
+
+
+def test_wait_all_times_out(monkeypatch):
+    client, _ = _client(monkeypatch, [{"a": 10}] * 100)
+    with pytest.raises(TimeoutError):
+        client.backtests.wait_all(1, ["a"], timeout=0)
+
+
+def test_tracker_interval_follows_eta():
+    tracker = ProgressTracker(1.0, 60.0)
+    assert tracker.update({"a": 0.0}, now=0.0) == 1.5
+    # 10% per 10s -> 90s to go, poll at half the ETA (clamped)
+    assert tracker.update({"a": 0.1}, now=10.0) == 45.0
+    assert tracker.update({"a": 0.99}, now=20.0) == 1.0
+
+
+def test_parameter_key_normalizes_values():
+    as_list = [{"name": "a", "value": 0.5}, {"name": "b", "value": "10"}]
+    assert parameter_key({"b": 10, "a": "0.5"}) == parameter_key(as_list)
+    assert parameter_key({"a": 1}) != parameter_key({"a": 2})
+
+
+def test_create_missing_reuses_recorded_runs(monkeypatch, tmp_path):
+    client = QCClient("https://example.invalid", "user", "token")
+    statuses = {}
+    created = []
+
+    def list_backtests(project_id, include_statistics=True):
+        return SimpleNamespace(
+            backtests=[
+                SimpleNamespace(backtestId=bt_id, status=status, parameterSet=parameters, progress=0)
+                for bt_id, (status, parameters) in statuses.items()
+            ]
+        )
+
+    def create(project_id, compile_id, backtest_name, parameters):
+        backtest_id = f"bt{len(created)}"
+        created.append(backtest_name)
+        statuses[backtest_id] = ("In Queue...", {})
+        return SimpleNamespace(backtest=SimpleNamespace(backtest_id=backtest_id))
+
+    monkeypatch.setattr(client.backtests, "list", list_backtests)
+    monkeypatch.setattr(client.backtests, "create", create)
+    points = [{"fast": 10, "slow": 100}, {"fast": 20, "slow": 100}]
+
+    ledger = RunLedger(tmp_path / "runs.json")
+    first = client.backtests.create_missing(1, "c1", points, signature="sig", ledger=ledger)
+    assert first == ["bt0", "bt1"]
+    assert created == ["fast=10 slow=100", "fast=20 slow=100"]
+
+    statuses["bt0"] = ("Completed.", {"fast": "10", "slow": "100"})
+    statuses["bt1"] = ("Runtime Error", {"fast": "20", "slow": "100"})
+    # a resumed sweep with one extra point, reloading the ledger from disk
+    resumed = RunLedger(tmp_path / "runs.json")
+    points.append({"fast": 30, "slow": 100})
+    second = client.backtests.create_missing(1, "c1", points, signature="sig", ledger=resumed)
+    assert second == ["bt0", "bt2", "bt3"]
+    # other code never reuses these runs
+    assert client.backtests.create_or_reuse(1, "c2", "new", points[0], signature="other", ledger=resumed) == "bt4"
+
+
+def test_prune_rule():
+    rule = PruneRule("drawdown", above=0.2, after=0.3)
+    assert not rule(0.2, {"drawdown": 0.5})
+    assert rule(0.3, {"drawdown": 0.5})
+    assert not rule(0.5, {"drawdown": 0.1})
+    assert not rule(0.5, {})
+
+
+def test_run_ledger_concurrent_writers_keep_every_record(tmp_path):
+    path = tmp_path / "runs.json"
+    shared = RunLedger(path)
+
+    def write(writer):
+        # one ledger shared by threads, the others each opened separately like another process would
+        ledger = shared if writer % 2 else RunLedger(path)
+        for i in range(25):
+            ledger.record("sig", {"writer": writer, "i": i}, f"bt{writer}-{i}")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(write, range(4)))
+    assert len(RunLedger(path).runs("sig")) == 100
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def _sweep_client(monkeypatch, timelines):
+    """Client whose backtests follow `timelines`: id -> (progress, drawdown) or an exception per read"""
+    client = QCClient("https://example.invalid", "user", "token")
+    created, deleted = [], []
+
+    def create(project_id, compile_id, backtest_name, parameters):
+        created.append(parameters["fast"])
+        return SimpleNamespace(backtest=SimpleNamespace(backtest_id=f"bt{len(created) - 1}"))
+
+    def list_backtests(project_id, include_statistics=True):
+        summaries = [
+            SimpleNamespace(backtestId=f"bt{i}", status="In Progress...", parameterSet={}, progress=0)
+            for i in range(len(created))
+            if f"bt{i}" not in deleted
+        ]
+        return SimpleNamespace(backtests=summaries)
+
+    def read(project_id, backtest_id):
+        step = timelines[backtest_id].pop(0)
+        if isinstance(step, Exception):
+            raise step
+        progress, drawdown = step
+        backtest = BacktestResult.model_construct(
+            backtest_id=backtest_id,
+            completed=progress >= 1,
+            status=BacktestStatus.COMPLETED if progress >= 1 else BacktestStatus.IN_PROGRESS,
+            progress=progress,
+            statistics=StatisticsResult.model_construct(drawdown=drawdown),
+            runtime_statistics=RuntimeStatistics.model_construct(),
+            parameter_set={},
+        )
+        return BacktestResponse.model_construct(backtest=backtest, success=True)
+
+    monkeypatch.setattr(client.backtests, "create", create)
+    monkeypatch.setattr(client.backtests, "list", list_backtests)
+    monkeypatch.setattr(client.backtests, "read", read)
+    monkeypatch.setattr(client.backtests, "delete", lambda project_id, backtest_id: deleted.append(backtest_id))
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    return client, created, deleted
+
+
+def test_sweep_prunes_losing_runs_and_refills_slots(monkeypatch):
+    client, created, deleted = _sweep_client(
+        monkeypatch,
+        {
+            "bt0": [(0.1, "5%"), (0.5, "40%"), (0.9, "40%")],
+            "bt1": [(0.2, "2%"), (0.6, "3%"), (1.0, "3%")],
+            "bt2": [(0.5, "1%"), (1.0, "1%")],
+        },
+    )
+    points = [{"fast": fast} for fast in (10, 20, 30)]
+    monitor = client.backtests.sweep(1, "c1", points, [PruneRule("drawdown", above=0.25, after=0.3)], max_concurrent=2)
+    results = monitor.run(interval=0)
+    assert deleted == ["bt0"]
+    assert results.pruned == {"bt0": "drawdown > 0.25 after 30%"}
+    assert sorted(results.completed) == ["bt1", "bt2"]
+    assert created == [10, 20, 30]
+
+
+def test_sweep_retries_failed_reads_and_forgets_pruned_runs(monkeypatch):
+    client, created, deleted = _sweep_client(
+        monkeypatch,
+        {
+            "bt0": [(0.5, "40%")],
+            "bt1": [QCException("Gateway timeout"), (0.5, "1%"), (1.0, "1%")],
+            "bt2": [QCException("Backtest not found")] * 2,
+        },
+    )
+    ledger = RunLedger()
+    points = [{"fast": fast} for fast in (10, 20, 30)]
+    rules = [PruneRule("drawdown", above=0.25)]
+    monitor = client.backtests.sweep(
+        1, "c1", points, rules, ledger=ledger, signature="sig", delete=False, max_failures=2
+    )
+    results = monitor.run(interval=0)
+    assert deleted == []
+    assert list(results.pruned) == ["bt0"]
+    assert list(results.completed) == ["bt1"]
+    assert list(results.errors) == ["bt2"]
+    # the pruned point is launched again instead of being reused
+    assert ledger.get("sig", points[0]) is None
+    assert client.backtests.create_or_reuse(1, "c1", "again", points[0], signature="sig", ledger=ledger) == "bt3"
+
+
+def test_sweep_lists_reusable_runs_once_per_poll(monkeypatch):
+    client, created, deleted = _sweep_client(monkeypatch, {f"bt{i}": [(1.0, "1%")] for i in range(4)})
+    list_backtests = client.backtests.list
+    calls = []
+    monkeypatch.setattr(client.backtests, "list", lambda *args, **kwargs: calls.append(args) or list_backtests(*args))
+    points = [{"fast": fast} for fast in (10, 20, 30, 40)]
+    created.append(10)
+    ledger = RunLedger()
+    ledger.record("sig", points[0], "bt0")
+    monitor = client.backtests.sweep(1, "c1", points, ledger=ledger, signature="sig", max_concurrent=4)
+    monitor.poll()
+    assert len(calls) == 1
+    assert created == [10, 20, 30, 40]
+    assert sorted(monitor.results.completed) == ["bt0", "bt1", "bt2", "bt3"]
+
+
+def test_sweep_given_up_runs_hold_their_slot_until_deleted(monkeypatch):
+    client, created, deleted = _sweep_client(
+        monkeypatch, {"bt0": [QCException("Gateway timeout")] * 2, "bt1": [(1.0, "1%")]}
+    )
+    attempts = []
+
+    def delete(project_id, backtest_id):
+        attempts.append(backtest_id)
+        if len(attempts) == 1:
+            raise QCException("Gateway timeout")
+        deleted.append(backtest_id)
+
+    monkeypatch.setattr(client.backtests, "delete", delete)
+    points = [{"fast": fast} for fast in (10, 20)]
+    monitor = client.backtests.sweep(1, "c1", points, max_concurrent=1, max_failures=2)
+    for _ in range(3):
+        monitor.poll()
+    # bt0 was given up on after two failed reads but may still occupy the node
+    assert created == [10]
+    assert list(monitor.results.errors) == ["bt0"]
+    results = monitor.run(interval=0)
+    assert deleted == ["bt0"]
+    assert created == [10, 20]
+    assert list(results.completed) == ["bt1"]
+
+
+def test_read_many_reports_errors_per_item(monkeypatch):
+    client = QCClient("https://example.invalid", "user", "token")
+
+    def read(project_id, backtest_id):
+        if backtest_id == "bad":
+            raise QCException("Backtest not found")
+        return SimpleNamespace(backtest=SimpleNamespace(backtest_id=backtest_id))
+
+    monkeypatch.setattr(client.backtests, "read", read)
+    results = list(client.backtests.read_many(1, ["a", "bad", "c"], max_workers=2, ordered=True))
+    assert [bt_id for bt_id, _, _ in results] == ["a", "bad", "c"]
+    assert results[0][1].backtest.backtest_id == "a" and results[0][2] is None
+    assert results[1][1] is None and isinstance(results[1][2], QCException)
+
+
+def test_read_optimization_collects_results_charts_and_errors(monkeypatch):
+    client = QCClient("https://example.invalid", "user", "token")
+
+    def list_backtests(project_id, include_statistics=True):
+        summaries = [
+            SimpleNamespace(backtestId="a", optimizationId="opt"),
+            SimpleNamespace(backtestId="b", optimizationId="opt"),
+            SimpleNamespace(backtestId="bad", optimizationId="opt"),
+            SimpleNamespace(backtestId="other", optimizationId="opt2"),
+            SimpleNamespace(backtestId="single", optimizationId=None),
+        ]
+        return SimpleNamespace(backtests=summaries)
+
+    def read(project_id, backtest_id):
+        if backtest_id == "bad":
+            raise QCException("Backtest not found")
+        backtest = BacktestResult.model_construct(
+            backtest_id=backtest_id,
+            statistics=StatisticsResult.model_construct(sharpe_ratio="1.5" if backtest_id == "a" else "0.5"),
+            runtime_statistics=RuntimeStatistics.model_construct(),
+            parameter_set={"fast": "10" if backtest_id == "a" else "20"},
+        )
+        return BacktestResponse.model_construct(backtest=backtest, success=True)
+
+    chart_reads = []
+
+    def read_chart(project_id, backtest_id, name, count):
+        chart_reads.append((backtest_id, name))
+        chart = None if name == "Missing" else SimpleNamespace(name=name)
+        return SimpleNamespace(chart=chart)
+
+    monkeypatch.setattr(client.backtests, "list", list_backtests)
+    monkeypatch.setattr(client.backtests, "read", read)
+    monkeypatch.setattr(client.backtests.chart, "read", read_chart)
+
+    assert [bt.backtestId for bt in client.backtests.list_optimization(1, "opt")] == ["a", "b", "bad"]
+    results = client.backtests.read_optimization(1, "opt", charts=["Equity", "Missing"], max_workers=2)
+    assert len(results) == 3
+    assert sorted(results.backtests) == ["a", "b"]
+    assert list(results.errors) == ["bad"] and isinstance(results.errors["bad"], QCException)
+    assert {bt_id: list(charts) for bt_id, charts in results.charts.items()} == {"a": ["Equity"], "b": ["Equity"]}
+    assert sorted(chart_reads) == [("a", "Equity"), ("a", "Missing"), ("b", "Equity"), ("b", "Missing")]
+
+    table = results.table()
+    by_id = {record["backtestId"]: record for record in table.to_records()}
+    assert by_id["a"]["parameter.fast"] == 10.0 and by_id["b"]["parameter.fast"] == 20.0
+    assert table.rank("sharpe_ratio") == ["a", "b"]
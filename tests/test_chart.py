@@ -1,5 +1,168 @@
-from qcapi import QCClient
+from types import SimpleNamespace
+
+from qcapi import ChartStore, QCClient
+from qcapi._backtests._chart import ChartEndpoint, ChartFollower, ReadChartResponse
+from qcapi.errors import QCException
 
 
 def test_chart_read(qc_client: QCClient, project_id: str, chart_backtest_id: str):
     qc_client.backtests.chart.read(project_id, chart_backtest_id, "Strategy Equity", 1000)
+
+
+class _FakeChartEndpoint:
+    def __init__(self, points, empty_series=()):
+        self.points = points
+        self.empty_series = empty_series
+        self.starts = []
+
+    def read(self, project_id, backtest_id, name, count, start=None, end=None):
+        self.starts.append(start)
+        values = [p for p in self.points if start is None or p[0] >= start][:count]
+        series = {"Equity": dict(name="Equity", unit="$", values=values, index=0, seriesType=0)}
+        for empty in self.empty_series:
+            series[empty] = dict(name=empty, unit="$", values=[], index=1, seriesType=0)
+        return ReadChartResponse(chart=dict(name=name, chartType=0, series=series), success=True)
+
+
+def test_chart_follower_appends_only_new_points():
+    endpoint = _FakeChartEndpoint([[1, 10.0], [2, 11.0]])
+    follower = ChartFollower(endpoint, 1, "bt", "Strategy Equity")
+    assert follower.poll() == {"Equity": 2}
+    endpoint.points += [[3, 12.0], [4, 13.0]]
+    assert follower.poll() == {"Equity": 2}
+    assert endpoint.starts == [None, 2]
+    tail = follower.series["Equity"]
+    assert list(tail.columns["time"]) == [1, 2, 3, 4]
+    assert list(tail.columns["value"]) == [10.0, 11.0, 12.0, 13.0]
+
+
+def test_chart_follower_ignores_empty_series_for_start():
+    endpoint = _FakeChartEndpoint([[1, 10.0], [2, 11.0]], empty_series=["Benchmark"])
+    follower = ChartFollower(endpoint, 1, "bt", "Strategy Equity")
+    follower.poll()
+    endpoint.points.append([3, 12.0])
+    assert follower.poll() == {"Equity": 1, "Benchmark": 0}
+    follower.poll()
+    assert endpoint.starts == [None, 2, 3]
+
+
+def test_chart_store_round_trip(tmp_path):
+    candles = [[t, 1.0 + t, 2.0 + t, 0.5 + t, 1.5 + t] for t in range(100)]
+    series = dict(name="Equity", unit="$", values=candles, index=0, seriesType=2)
+    chart = ReadChartResponse(chart=dict(name="Strategy Equity", chartType=0, series={"Equity": series}), success=True)
+    store = ChartStore(tmp_path)
+    assert ("bt", "Strategy Equity") not in store
+    store.put("bt", chart.chart)
+
+    stored = store.get("bt", "Strategy Equity")
+    assert ("bt", "Strategy Equity") in store
+    equity = stored.series["Equity"]
+    assert len(equity) == 100
+    assert equity.columns["close"][10] == 11.5
+    assert stored.to_chart().series["Equity"].values == candles
+
+
+def test_chart_store_keeps_dict_points(tmp_path):
+    points = [{"x": t, "y": t * 2.0} for t in range(5)]
+    series = dict(name="Trades", unit="$", values=points, index=0, seriesType=1)
+    chart = ReadChartResponse(chart=dict(name="Assets", chartType=0, series={"Trades": series}), success=True)
+    store = ChartStore(tmp_path)
+    store.put("bt", chart.chart)
+    assert store.get("bt", "Assets").to_chart().series["Trades"].values == points
+
+
+def test_chart_store_rewrite_does_not_mix_generations(tmp_path):
+    def chart(length):
+        series = dict(name="S", unit="$", values=[[t, 10.0 + t] for t in range(length)], index=0, seriesType=0)
+        return ReadChartResponse(chart=dict(name="C", chartType=0, series={"S": series}), success=True).chart
+
+    store = ChartStore(tmp_path)
+    store.put("bt", chart(10))
+    before = store.get("bt", "C")
+    store.put("bt", chart(20))
+    # a reader holding the old generation keeps consistent columns
+    assert list(before.series["S"].columns["value"])[:3] == [10.0, 11.0, 12.0]
+    after = store.get("bt", "C")
+    assert len(after.series["S"]) == 20
+    assert list(after.series["S"].columns["value"])[:3] == [10.0, 11.0, 12.0]
+    assert len(list((tmp_path / "bt" / "C").glob("*.f64"))) == 1
+
+
+def _chart(length):
+    series = dict(name="S", unit="$", values=[[t, 10.0 + t] for t in range(length)], index=0, seriesType=0)
+    return ReadChartResponse(chart=dict(name="C", chartType=0, series={"S": series}), success=True).chart
+
+
+def test_chart_store_missing_series_file_is_a_miss(tmp_path):
+    store = ChartStore(tmp_path)
+    store.put("bt", _chart(10))
+    for path in (tmp_path / "bt" / "C").glob("*.f64"):
+        path.unlink()
+    assert store.get("bt", "C") is None
+
+
+def test_chart_store_concurrent_puts_keep_current_files(tmp_path):
+    store = ChartStore(tmp_path)
+    store.put("bt", _chart(5))
+    read_meta = store._read_meta
+
+    def racing_read_meta(chart_dir):
+        # another writer commits between this put writing its files and committing meta.json
+        text = read_meta(chart_dir)
+        store._read_meta = read_meta
+        store.put("bt", _chart(20))
+        return text
+
+    store._read_meta = racing_read_meta
+    store.put("bt", _chart(10))
+    assert len(store.get("bt", "C").series["S"]) == 10
+
+
+def test_chart_store_fetch_only_stores_completed_backtests(tmp_path):
+    completed = False
+    backtests = SimpleNamespace(
+        chart=_FakeChartEndpoint([[1, 10.0], [2, 11.0]]),
+        read=lambda project_id, backtest_id: SimpleNamespace(backtest=SimpleNamespace(completed=completed)),
+    )
+    client = SimpleNamespace(backtests=backtests)
+    store = ChartStore(tmp_path)
+    running = store.fetch(client, 1, "bt", "Strategy Equity")
+    assert list(running.series["Equity"].columns["value"]) == [10.0, 11.0]
+    assert running.to_chart().series["Equity"].values == [[1, 10.0], [2, 11.0]]
+    assert ("bt", "Strategy Equity") not in store
+    completed = True
+    store.fetch(client, 1, "bt", "Strategy Equity")
+    assert ("bt", "Strategy Equity") in store
+
+
+class _GeneratingChartEndpoint(ChartEndpoint):
+    def __init__(self, polls_until_ready, failing=()):
+        self.polls = {}
+        self.polls_until_ready = polls_until_ready
+        self.failing = failing
+
+    def read(self, project_id, backtest_id, name, count, start=None, end=None):
+        if name in self.failing:
+            raise QCException(f"Chart {name} not found")
+        self.polls[name] = self.polls.get(name, 0) + 1
+        if self.polls[name] <= self.polls_until_ready:
+            return ReadChartResponse(progress=50, success=True)
+        return ReadChartResponse(chart=dict(name=name, chartType=0, series={}), success=True)
+
+
+def test_chart_read_all_waits_for_generation(monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    endpoint = _GeneratingChartEndpoint(polls_until_ready=2)
+    charts, errors = endpoint.read_all(1, "bt", ["Strategy Equity", "Benchmark", "Drawdown"])
+    assert errors == {}
+    assert list(charts) == ["Strategy Equity", "Benchmark", "Drawdown"]
+    assert charts["Benchmark"].name == "Benchmark"
+    assert endpoint.polls == {"Strategy Equity": 3, "Benchmark": 3, "Drawdown": 3}
+
+
+def test_chart_read_all_keeps_charts_read_before_a_failure(monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    endpoint = _GeneratingChartEndpoint(polls_until_ready=0, failing=["Benchmark"])
+    charts, errors = endpoint.read_all(1, "bt", ["Strategy Equity", "Benchmark", "Drawdown"])
+    assert list(charts) == ["Strategy Equity", "Drawdown"]
+    assert list(errors) == ["Benchmark"] and isinstance(errors["Benchmark"], QCException)
@@ -0,0 +1,120 @@
+import gc
+import json
+import weakref
+from types import SimpleNamespace
+
+import pytest
+
+from qcapi._cli import ParquetWriter, main
+from qcapi.models import Order
+
+
+@pytest.fixture
+def fake_client(monkeypatch, order_payload):
+    first_page = [Order.model_validate(dict(order_payload, id=i)) for i in range(100)]
+    pages = [first_page, [Order.model_validate(order_payload)]]
+    orders = SimpleNamespace(iter_pages=lambda project_id, backtest_id=None: iter(pages))
+    client = SimpleNamespace(backtests=SimpleNamespace(orders=orders), live=SimpleNamespace(orders=orders))
+    monkeypatch.setattr("qcapi._client.QCClient", lambda *args, **kwargs: client)
+    return client
+
+
+def test_orders_export_ndjson(fake_client, tmp_path):
+    output = tmp_path / "orders.ndjson"
+    assert main(["--user-id", "u", "--token", "t", "-o", str(output), "orders", "1", "--backtest", "bt"]) == 0
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert len(rows) == 101
+    assert rows[5]["id"] == 5
+    assert rows[0]["symbol"]["value"] == "SPY"
+
+
+def test_missing_credentials(monkeypatch):
+    monkeypatch.delenv("USER_ID", raising=False)
+    monkeypatch.delenv("TOKEN", raising=False)
+    with pytest.raises(SystemExit):
+        main(["backtests", "1"])
+
+
+def test_orders_export_parquet(fake_client, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "orders.parquet"
+    argv = ["--format", "parquet", "--user-id", "u", "--token", "t", "-o", str(output), "orders", "1", "--live"]
+    assert main(argv) == 0
+    table = pq.read_table(output)
+    assert table.num_rows == 101
+    assert pq.ParquetFile(output).num_row_groups == 2
+    row = table.slice(100).to_pylist()[0]
+    assert json.loads(row["properties"]) == {"timeInForce": {}}
+    assert json.loads(row["symbol"])["value"] == "SPY"
+    assert json.loads(row["events"])[0]["fillPrice"] == 400.5
+
+
+def test_parquet_columns_empty_in_first_batch(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "rows.parquet"
+    with open(output, "wb") as stream:
+        writer = ParquetWriter(stream)
+        writer.write([{"id": 1, "properties": None}])
+        writer.write([{"id": 2, "properties": {"timeInForce": {"expiry": "2023-01-31"}}}])
+        with pytest.raises(ValueError):
+            writer.write([{"id": 3, "extra": 1}])
+        writer.close()
+    rows = pq.read_table(output).to_pylist()
+    assert rows[0] == {"id": 1, "properties": None}
+    assert json.loads(rows[1]["properties"]) == {"timeInForce": {"expiry": "2023-01-31"}}
+
+
+def test_charts_export_parquet_mixes_series_types(monkeypatch, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    from qcapi.models import Chart
+
+    series = {
+        "Equity": dict(name="Equity", unit="$", values=[[1, 10.0, 11.0, 9.0, 10.5]], index=0, seriesType=2),
+        "Return": dict(name="Return", unit="%", values=[[1, 0.5], [2, 0.25]], index=1, seriesType=3),
+    }
+    chart = Chart.model_validate(dict(name="Strategy Equity", chartType=0, series=series))
+    charts = SimpleNamespace(read_complete=lambda project_id, backtest_id, name, count: chart)
+    client = SimpleNamespace(backtests=SimpleNamespace(chart=charts))
+    monkeypatch.setattr("qcapi._client.QCClient", lambda *args, **kwargs: client)
+    output = tmp_path / "charts.parquet"
+    argv = ["--format", "parquet", "--user-id", "u", "--token", "t", "-o", str(output)]
+    assert main([*argv, "charts", "1", "bt", "--chart", "Strategy Equity"]) == 0
+    rows = pq.read_table(output).to_pylist()
+    assert rows[0] == dict(
+        chart="Strategy Equity", series="Equity", time=1.0, value=None, open=10.0, high=11.0, low=9.0, close=10.5
+    )
+    assert rows[2] == dict(
+        chart="Strategy Equity", series="Return", time=2.0, value=0.25, open=None, high=None, low=None, close=None
+    )
+
+
+def test_results_export_holds_a_bounded_number_of_backtests(monkeypatch, tmp_path):
+    from qcapi import QCClient
+
+    client = QCClient("https://example.invalid", "user", "token")
+    alive = weakref.WeakSet()
+    peak = 0
+
+    class Backtest:
+        def __init__(self, backtest_id):
+            self.backtest_id = backtest_id
+
+        def model_dump(self, **kwargs):
+            return {"backtestId": self.backtest_id}
+
+    def read(project_id, backtest_id):
+        nonlocal peak
+        response = SimpleNamespace(backtest=Backtest(backtest_id))
+        alive.add(response.backtest)
+        gc.collect()
+        peak = max(peak, len(alive))
+        return response
+
+    monkeypatch.setattr(client.backtests, "read", read)
+    monkeypatch.setattr("qcapi._client.QCClient", lambda *args, **kwargs: client)
+    output = tmp_path / "results.ndjson"
+    ids = [f"bt{i}" for i in range(40)]
+    assert main(["--user-id", "u", "--token", "t", "-o", str(output), "results", "1", *ids, "--workers", "2"]) == 0
+    assert len(output.read_text().splitlines()) == 40
+    # the window of in-flight reads plus the row being written
+    assert peak <= 4
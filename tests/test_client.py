@@ -0,0 +1,64 @@
+import threading
+import time
+
+from qcapi import QCClient
+
+
+class _CountingClient(QCClient):
+    def __init__(self, **kwargs):
+        super().__init__("https://example.invalid", "user", "token", **kwargs)
+        self.calls = 0
+        self.release = threading.Event()
+
+    def _request(self, method, url, json, params, response_type):
+        self.calls += 1
+        self.release.wait(5)
+        if json and json.get("fail"):
+            raise RuntimeError("boom")
+        return object()
+
+
+def _concurrently(client, n, *args, **kwargs):
+    results, errors = [], []
+
+    def run():
+        try:
+            results.append(client.request(*args, **kwargs))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    client.release.set()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_identical_reads_share_one_call():
+    client = _CountingClient()
+    results, _ = _concurrently(client, 8, "GET", "/backtests/read", json={"projectId": 1, "backtestId": "a"})
+    assert client.calls == 1
+    assert len(results) == 8 and all(r is results[0] for r in results)
+
+
+def test_writes_are_not_coalesced():
+    client = _CountingClient()
+    _concurrently(client, 4, "POST", "/backtests/create", json={"projectId": 1})
+    assert client.calls == 4
+
+
+def test_errors_are_shared():
+    client = _CountingClient()
+    _, errors = _concurrently(client, 4, "GET", "/backtests/read", json={"fail": True})
+    assert client.calls == 1
+    assert len(errors) == 4
+
+
+def test_coalescing_can_be_disabled():
+    client = _CountingClient(coalesce=False)
+    _concurrently(client, 3, "GET", "/backtests/read", json={"projectId": 1})
+    assert client.calls == 3
+
@@ -0,0 +1,41 @@
+import threading
+import time
+
+import pytest
+
+from qcapi._concurrency import map_concurrent
+
+
+@pytest.mark.parametrize("ordered", [False, True])
+def test_map_concurrent_keeps_a_bounded_window(ordered):
+    lock = threading.Lock()
+    active = peak = 0
+    consumed = []
+
+    def items():
+        for i in range(50):
+            consumed.append(i)
+            yield i
+
+    def work(i):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.001 * (i % 3))
+        with lock:
+            active -= 1
+        if i == 7:
+            raise ValueError(i)
+        return i * 2
+
+    results = []
+    for item, result, error in map_concurrent(work, items(), max_workers=4, ordered=ordered):
+        # never more than the window submitted ahead of what was yielded
+        assert len(consumed) <= len(results) + 5
+        results.append((item, result, type(error)))
+    assert peak <= 4
+    expected = [(i, None, ValueError) if i == 7 else (i, i * 2, type(None)) for i in range(50)]
+    assert sorted(results) == expected
+    if ordered:
+        assert [item for item, _, _ in results] == list(range(50))
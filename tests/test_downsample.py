@@ -0,0 +1,41 @@
+import math
+
+from qcapi.models import ChartSeries, ChartSeriesTypeEnum
+from qcapi.models._downsample import lttb, minmax, resample_ohlc
+
+
+def test_lttb_keeps_endpoints_and_budget():
+    times = list(range(1000))
+    values = [math.sin(t / 50) for t in times]
+    keep = lttb(times, values, 100)
+    assert len(keep) == 100
+    assert keep[0] == 0 and keep[-1] == 999
+    assert keep == sorted(keep)
+
+
+def test_minmax_preserves_extrema():
+    values = [0.0] * 1000
+    values[123] = 50.0
+    values[877] = -50.0
+    keep = minmax(values, 20)
+    assert 123 in keep and 877 in keep
+    assert len(keep) <= 20
+
+
+def test_resample_ohlc():
+    candles = resample_ohlc([0, 1, 2, 3], [1, 2, 3, 4], [5, 9, 6, 7], [0, -1, 1, 2], [2, 3, 4, 5], 2)
+    assert candles == [[0, 1, 9, -1, 3], [2, 3, 7, 1, 5]]
+
+
+def test_series_downsample_keeps_point_format():
+    series = ChartSeries(
+        name="Equity",
+        unit="$",
+        values=[[t, float(t % 7)] for t in range(5000)],
+        index=0,
+        seriesType=ChartSeriesTypeEnum.Line,
+    )
+    reduced = series.downsample(500)
+    assert len(reduced.values) == 500
+    assert reduced.values[0] == [0, 0.0]
+    assert len(series.values) == 5000
@@ -0,0 +1,53 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from qcapi.analysis import EquityPanel, analyze  # noqa: E402
+
+DAY = 86_400
+
+
+def _panel():
+    times = [i * DAY for i in range(10)]
+    up = [100.0 + i for i in range(10)]
+    dip = [100.0, 110.0, 99.0, 88.0, 95.0, 100.0, 105.0, 115.0, 120.0, 121.0]
+    late = [50.0, 51.0, 53.0, 52.0, 55.0]
+    return EquityPanel.align({"up": (times, up), "dip": (times, dip), "late": (times[5:], late)})
+
+
+def test_align_forward_fills_and_masks_before_start():
+    panel = _panel()
+    assert panel.values.shape == (10, 3)
+    assert np.isnan(panel.values[:5, 2]).all()
+    assert panel.values[5, 2] == 50.0
+
+
+def test_drawdown_and_correlation():
+    panel = _panel()
+    metrics = analyze(panel, window=3, processes=1)
+    assert metrics.max_drawdown[0] == 0.0
+    assert metrics.max_drawdown[1] == pytest.approx(88.0 / 110.0 - 1.0)
+    assert metrics.correlation[0, 0] == pytest.approx(1.0)
+    assert np.isnan(metrics.rolling_sharpe[:3, 0]).all()
+    assert not np.isnan(metrics.rolling_volatility[3:, 1]).any()
+
+
+def test_process_pool_matches_serial():
+    rng = np.random.default_rng(0)
+    values = 100 * np.cumprod(1 + rng.normal(0, 0.01, size=(200, 10)), axis=0)
+    panel = EquityPanel([str(i) for i in range(10)], np.arange(200.0), values)
+    serial = analyze(panel, window=20, processes=1, chunk_size=4)
+    pooled = analyze(panel, window=20, processes=2, chunk_size=4)
+    np.testing.assert_allclose(serial.rolling_sharpe, pooled.rolling_sharpe, equal_nan=True)
+    np.testing.assert_allclose(serial.drawdown, pooled.drawdown, equal_nan=True)
+    corr = np.corrcoef(panel.returns()[1:].T)
+    np.testing.assert_allclose(serial.correlation, corr, atol=1e-12)
+
+
+def test_daily_grid_annualizes_calendar_days():
+    panel = _panel()
+    assert panel.step == DAY
+    assert panel.periods_per_year == pytest.approx(365.25)
+    metrics = analyze(panel, window=3, processes=1)
+    returns = panel.returns()[1:4, 1]
+    assert metrics.rolling_volatility[3, 1] == pytest.approx(np.std(returns, ddof=1) * np.sqrt(365.25))
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+# generous ceiling, `import qcapi` should only cost the package __init__ itself
+IMPORT_BUDGET_US = 50_000
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+
+
+def test_import_qcapi_is_lazy():
+    result = _run("import sys, qcapi; print(','.join(sorted(sys.modules)))")
+    modules = set(result.stdout.strip().split(","))
+    assert "requests" not in modules
+    assert "pydantic" not in modules
+    assert "qcapi._client" not in modules
+
+
+def test_import_qcapi_budget():
+    result = _run("import qcapi")
+    cumulative = [
+        int(line.split("|")[1]) for line in result.stderr.splitlines() if line.split("|")[-1].strip() == "qcapi"
+    ]
+    assert cumulative and cumulative[0] < IMPORT_BUDGET_US
+
+
+def test_compile_endpoint_does_not_load_backtest_models():
+    result = _run(
+        "import sys, qcapi; qcapi.QCClient('url', 'user', 'token').compile; print(','.join(sorted(sys.modules)))"
+    )
+    modules = set(result.stdout.strip().split(","))
+    assert "qcapi._compile" in modules
+    assert "qcapi.models._backtest_models" not in modules
+    assert "qcapi._backtests" not in modules
@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from qcapi import QCClient
+from qcapi._backtests._orders import BacktestOrdersResponse
+from qcapi._live._orders import LiveOrdersResponse
+from qcapi.errors import QCException
+from qcapi.models._registry import decode_json, validate
+
+
+class _FakeResponse:
+    def __init__(self, body: dict):
+        self.content = json.dumps(body).encode()
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class _FakeSession:
+    def __init__(self, body: dict):
+        self.body = body
+
+    def prepare_request(self, request):
+        return request
+
+    def send(self, request, timeout=None):
+        return _FakeResponse(self.body)
+
+
+class _FakeClient(QCClient):
+    def __init__(self, body: dict):
+        super().__init__("https://example.invalid", "user", "token")
+        self.fake_session = _FakeSession(body)
+
+    @property
+    def _session(self):
+        return self.fake_session
+
+
+@pytest.mark.parametrize("response_type", [BacktestOrdersResponse, LiveOrdersResponse])
+def test_json_fast_path_matches_dict_validation(order_page, response_type):
+    page = order_page()
+    fast = decode_json(response_type, json.dumps(page).encode())
+    assert fast == validate(response_type, page)
+    assert fast.orders[0].events[0] == validate(response_type, page).orders[0].events[0]
+
+
+def test_json_fast_path_rejects_error_bodies():
+    error = {"success": False, "errors": ["Backtest not found"]}
+    assert decode_json(LiveOrdersResponse, json.dumps(error).encode()) is None
+
+
+def test_orders_read_through_fast_path(order_page):
+    client = _FakeClient(order_page(2))
+    orders = client.backtests.orders.read(1, "bt", 0, 100).orders
+    assert [order.id for order in orders] == [0, 1]
+    assert orders[0].symbol.value == "SPY"
+
+
+def test_orders_error_falls_back_to_regular_handling():
+    client = _FakeClient({"success": False, "errors": ["Backtest not found"]})
+    with pytest.raises(QCException, match="Backtest not found"):
+        client.live.orders.read(1)
+
+
+@pytest.mark.parametrize("response_type", [BacktestOrdersResponse, LiveOrdersResponse])
+def test_orders_share_symbols_and_strings(order_page, response_type):
+    page = order_page()
+    for orders in (
+        decode_json(response_type, json.dumps(page).encode()).orders,
+        validate(response_type, json.loads(json.dumps(page))).orders,
+    ):
+        assert orders[0].symbol is orders[1].symbol is orders[2].symbol
+        assert orders[0].events[0].symbolValue is orders[2].events[0].symbolValue
+        assert orders[0].events[0].algorithmId is orders[2].events[0].algorithmId
+    # separate pages of the same history share the symbol as well
+    first = decode_json(response_type, json.dumps(page).encode())
+    second = decode_json(response_type, json.dumps(page).encode())
+    assert first.orders[0].symbol is second.orders[0].symbol
+
+
+def test_tolerant_client_quarantines_bad_orders(order_page, monkeypatch, tmp_path):
+    page = order_page(3)
+    page["orders"][0]["symbol"] = None
+    client = _FakeClient(page)
+    monkeypatch.chdir(tmp_path)
+    with client.tolerant() as quarantine:
+        response = client.request("GET", "/backtests/orders/read", json={}, response_type=BacktestOrdersResponse)
+    assert [order.id for order in response.orders] == [1, 2]
+    assert len(quarantine) == 1
+    assert not (tmp_path / "errors.json").exists()
+    assert client._quarantine is None
@@ -0,0 +1,74 @@
+import threading
+
+import pytest
+from requests import HTTPError, Response
+
+from qcapi import QCClientPool
+
+
+def _pool(monkeypatch, **kwargs):
+    pool = QCClientPool("https://example.invalid", [("u1", "t1"), ("u2", "t2")], **kwargs)
+    calls = []
+    for client in pool.clients:
+
+        def request(method, url, json, params, response_type, user=client.user):
+            calls.append((user, method, url))
+            return user
+
+        monkeypatch.setattr(client, "_request", request)
+    return pool, calls
+
+
+def test_requests_are_spread_by_load(monkeypatch):
+    pool, calls = _pool(monkeypatch)
+    users = [pool.request("GET", "/backtests/read", json=dict(projectId=1, backtestId=str(i))) for i in range(4)]
+    assert users == ["u1", "u2", "u1", "u2"]
+    stats = pool.utilization()
+    assert stats["u1"]["requests"] == stats["u2"]["requests"] == 2
+
+
+def test_in_flight_requests_steer_to_idle_credential(monkeypatch):
+    pool, _ = _pool(monkeypatch)
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow(method, url, json, params, response_type):
+        started.set()
+        release.wait(5)
+        return "u1"
+
+    monkeypatch.setattr(pool.clients[0], "_request", slow)
+    thread = threading.Thread(target=pool.request, args=("GET", "/backtests/read"), kwargs=dict(json={"a": 1}))
+    thread.start()
+    started.wait(5)
+    assert [pool.request("GET", "/backtests/read", json={"b": i}) for i in range(2)] == ["u2", "u2"]
+    assert pool.utilization()["u1"]["in_flight"] == 1
+    release.set()
+    thread.join()
+
+
+def test_assigned_and_sticky_projects(monkeypatch):
+    pool, _ = _pool(monkeypatch, sticky=True)
+    pool.assign_project(7, "u2")
+    assert {pool.request("GET", "/backtests/list", json=dict(projectId=7, i=i)) for i in range(3)} == {"u2"}
+    launched = pool.request("POST", "/backtests/create", json=dict(projectId=8))
+    assert {pool.request("GET", "/backtests/list", json=dict(projectId=8, i=i)) for i in range(3)} == {launched}
+    assert pool.utilization()[launched]["launches"] == 1
+    with pytest.raises(KeyError):
+        pool.assign_project(9, "nobody")
+
+
+def test_throttled_credential_is_retried_elsewhere(monkeypatch):
+    pool, calls = _pool(monkeypatch)
+
+    def throttled(method, url, json, params, response_type):
+        response = Response()
+        response.status_code = 429
+        raise HTTPError(response=response)
+
+    monkeypatch.setattr(pool.clients[0], "_request", throttled)
+    assert pool.request("GET", "/backtests/list", json=dict(projectId=1)) == "u2"
+    # u1 is cooling down, everything goes to u2 even though it has more requests
+    assert pool.request("GET", "/backtests/list", json=dict(projectId=2)) == "u2"
+    stats = pool.utilization()
+    assert stats["u1"]["throttled"] == 1 and stats["u1"]["errors"] == 1
@@ -0,0 +1,46 @@
+import pytest
+from pydantic import ValidationError
+
+from qcapi import Quarantine
+from qcapi._backtests._orders import BacktestOrdersResponse
+from qcapi.models import Order
+
+
+def test_bad_items_are_quarantined_and_the_rest_kept(order_page, tmp_path):
+    page = order_page(4)
+    del page["orders"][1]["events"][0]["fillPrice"]
+    page["orders"][3]["price"] = "not a price"
+    quarantine = Quarantine(tmp_path / "quarantine.ndjson")
+
+    response = quarantine.validate(BacktestOrdersResponse, page, url="/backtests/orders/read")
+    assert [order.id for order in response.orders] == [0, 2]
+    assert [item.payload["id"] for item in quarantine] == [1, 3]
+    assert quarantine.items[0].errors[0]["loc"] == ("events", 0, "fillPrice")
+    assert quarantine.items[0].context == dict(field="orders", index=1, url="/backtests/orders/read")
+    assert quarantine.drift() == {
+        "BacktestOrdersResponse.orders.*.events.*.fillPrice": {"missing": 1},
+        "BacktestOrdersResponse.orders.*.price": {"float_parsing": 1},
+    }
+    assert len((tmp_path / "quarantine.ndjson").read_text().splitlines()) == 2
+
+
+def test_top_level_lists_and_unsalvageable_payloads(order_payload):
+    quarantine = Quarantine()
+    orders = quarantine.validate(list[Order], [order_payload, dict(order_payload, quantity=None)])
+    assert len(orders) == 1 and len(quarantine) == 1
+    with pytest.raises(ValidationError):
+        quarantine.validate(BacktestOrdersResponse, {"orders": [], "length": "many", "success": True})
+    assert len(quarantine) == 2
+
+
+def test_wrong_typed_items_are_salvaged(order_page):
+    page = order_page(3)
+    page["orders"][1] = None
+    page["orders"][2] = "garbage"
+    quarantine = Quarantine()
+    response = quarantine.validate(BacktestOrdersResponse, page)
+    assert [order.id for order in response.orders] == [0]
+    assert [item.payload for item in quarantine] == [None, "garbage"]
+    assert [item.errors[0]["loc"] for item in quarantine] == [(), ()]
+    orders = quarantine.validate(list[Order], [42, page["orders"][0]])
+    assert [order.id for order in orders] == [0]
@@ -0,0 +1,21 @@
+from datetime import datetime, timezone
+
+from qcapi.models import Order, OrderStatus
+from qcapi.models._registry import construct_trusted, get_adapter, validate
+from qcapi.models._orders import OrderEventStatus
+
+
+
+def test_validate_list_payload_uses_cached_adapter(order_payload):
+    orders = validate(list[Order], [order_payload])
+    assert orders[0].symbol.value == "SPY"
+    assert get_adapter(list[Order]) is get_adapter(list[Order])
+
+
+def test_construct_trusted_matches_validation(order_payload):
+    order = Order.model_validate(order_payload)
+    rebuilt = construct_trusted(Order, order.model_dump(mode="json", by_alias=True))
+    assert rebuilt == order
+    assert rebuilt.status is OrderStatus.FILLED
+    assert rebuilt.events[0].status is OrderEventStatus.FILLED
+    assert rebuilt.time == datetime(2023, 1, 3, 14, 31, tzinfo=timezone.utc)
@@ -0,0 +1,36 @@
+import json
+import math
+from datetime import date
+
+from qcapi._streaming import iter_sections
+from qcapi.analysis import RollingWindowTable
+
+BACKTEST = {
+    "backtestId": "a",
+    "rollingWindow": {
+        "M3_20230331": {"portfolioStatistics": {"sharpeRatio": 0.9}, "tradeStatistics": {"totalNumberOfTrades": 4}},
+        "M1_20230228": {"portfolioStatistics": {"sharpeRatio": "1.5"}, "tradeStatistics": {}},
+        "M1_20230131": {"portfolioStatistics": {"sharpeRatio": -0.5, "drawdown": 0.1}, "tradeStatistics": None},
+    },
+}
+
+
+def test_rolling_window_table_from_raw_json():
+    table = RollingWindowTable.from_backtest({"backtest": BACKTEST})
+    assert len(table) == 3
+    assert table.periods == ["M1", "M1", "M3"]
+    assert table.end_dates == [date(2023, 1, 31), date(2023, 2, 28), date(2023, 3, 31)]
+    assert list(table.column("portfolio.sharpe_ratio", "M1")) == [-0.5, 1.5]
+    assert table.column("trade.total_number_of_trades")[2] == 4.0
+    assert math.isnan(table.column("portfolio.drawdown")[1])
+    assert table.period_names == ["M1", "M3"]
+    assert table.period("M3").to_records()[0]["portfolio.sharpe_ratio"] == 0.9
+
+
+def test_rolling_window_table_from_stream():
+    body = json.dumps({"backtest": BACKTEST, "success": True}).encode()
+    descend = {(), ("backtest",), ("backtest", "rollingWindow")}
+    sections = iter_sections([body[:50], body[50:]], lambda path: path in descend, lambda path: False)
+    streamed = RollingWindowTable.from_stream(sections)
+    # repr, so that NaN cells compare equal
+    assert repr(streamed.to_records()) == repr(RollingWindowTable.from_backtest(BACKTEST).to_records())
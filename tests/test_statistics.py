@@ -0,0 +1,39 @@
+import math
+
+from qcapi.analysis import StatisticsMatrix, parse_statistic
+
+
+def test_parse_statistic_units():
+    assert parse_statistic("12.5%") == (0.125, "%")
+    assert parse_statistic("-$1,234.56") == (-1234.56, "$")
+    assert parse_statistic("$2.5M") == (2_500_000.0, "$")
+    assert parse_statistic("0.8") == (0.8, "")
+    assert math.isnan(parse_statistic("SPY R735QTJ8XC9X")[0])
+    assert math.isnan(parse_statistic(None)[0])
+
+
+def test_statistics_matrix_from_raw_json():
+    backtests = [
+        {
+            "backtestId": "a",
+            "statistics": {"Sharpe Ratio": "1.2", "Drawdown": "10%"},
+            "runtimeStatistics": {"Equity": "$110,000.00"},
+            "parameterSet": {"ema_fast": "10"},
+        },
+        {
+            "backtest": {
+                "backtestId": "b",
+                "statistics": {"Sharpe Ratio": "2.4", "Drawdown": "5%"},
+                "runtimeStatistics": {},
+                "parameterSet": {"ema_fast": "20"},
+            }
+        },
+    ]
+    matrix = StatisticsMatrix.from_backtests(backtests)
+    assert matrix.index == ["a", "b"]
+    assert matrix.column("sharpe_ratio") == [1.2, 2.4]
+    assert matrix.column("drawdown") == [0.1, 0.05]
+    assert matrix.column("parameter.ema_fast") == [10.0, 20.0]
+    assert matrix.column("runtime.equity")[0] == 110_000.0
+    assert matrix.units["drawdown"] == "%"
+    assert matrix.rank("sharpe_ratio") == ["b", "a"]
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from qcapi._streaming import iter_sections
+
+DOCUMENT = {
+    "backtest": {
+        "name": 'quote " backslash \\ unicode é',
+        "statistics": {"Sharpe Ratio": "1.2"},
+        "rollingWindow": {"M1_20230131": {"closedTrades": [1, {"brace": "}]"}]}, "M1_20230228": {}},
+        "totalPerformance": {"closedTrades": [{"a": 1}, {"b": [2, 3]}], "tradeStatistics": {"z": None}},
+        "progress": 1.0,
+        "count": -12.5e3,
+        "completed": True,
+    },
+    "success": True,
+    "errors": [],
+}
+DESCEND = {
+    (),
+    ("backtest",),
+    ("backtest", "rollingWindow"),
+    ("backtest", "totalPerformance"),
+    ("backtest", "totalPerformance", "closedTrades"),
+}
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 16])
+def test_sections_match_json_loads(chunk_size):
+    data = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+    events = dict(iter_sections(_chunks(data, chunk_size), DESCEND.__contains__))
+    backtest = DOCUMENT["backtest"]
+    assert events[("backtest", "name")] == backtest["name"]
+    assert events[("backtest", "statistics")] == backtest["statistics"]
+    assert events[("backtest", "rollingWindow", "M1_20230131")] == backtest["rollingWindow"]["M1_20230131"]
+    assert events[("backtest", "totalPerformance", "closedTrades", 1)] == {"b": [2, 3]}
+    assert events[("backtest", "count")] == -12500.0
+    assert events[("success",)] is True
+    assert events[("errors",)] == []
+
+
+def test_skipped_sections_are_not_emitted():
+    data = json.dumps(DOCUMENT).encode()
+    skip = ("backtest", "rollingWindow")
+    events = dict(iter_sections(_chunks(data, 5), DESCEND.__contains__, skip=lambda path: path[:2] == skip))
+    assert not [path for path in events if path[:2] == ("backtest", "rollingWindow")]
+    assert events[("backtest", "progress")] == 1.0
+
+
+def test_truncated_document_raises():
+    data = json.dumps(DOCUMENT).encode()[:-10]
+    with pytest.raises(ValueError):
+        list(iter_sections(_chunks(data, 16), DESCEND.__contains__))
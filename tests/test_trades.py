@@ -0,0 +1,91 @@
+import pytest
+
+from qcapi.analysis import reconstruct_trades
+from qcapi.analysis._trades import format_duration
+from qcapi.models import Order
+
+T0 = 1_672_756_260.0
+
+
+def _order(order_id, fills, symbol="SPY"):
+    events = [
+        {
+            "algorithmId": "algo",
+            "symbol": f"{symbol} ID",
+            "symbolValue": symbol,
+            "symbolPermtick": symbol,
+            "orderId": order_id,
+            "orderEventId": i,
+            "id": f"{order_id}-{i}",
+            "status": "filled",
+            "orderFeeAmount": 1.0,
+            "orderFeeCurrency": "USD",
+            "fillPrice": price,
+            "fillPriceCurrency": "USD",
+            "fillQuantity": quantity,
+            "direction": "buy" if quantity > 0 else "sell",
+            "message": "",
+            "isAssignment": False,
+            "quantity": quantity,
+            "time": time,
+        }
+        for i, (time, quantity, price) in enumerate(fills)
+    ]
+    return Order.model_validate(
+        {
+            "id": order_id,
+            "brokerId": [],
+            "symbol": {"value": symbol, "id": f"{symbol} ID", "permtick": symbol},
+            "price": fills[0][2],
+            "priceCurrency": "USD",
+            "time": "2023-01-03T14:31:00Z",
+            "createdTime": "2023-01-03T14:31:00Z",
+            "quantity": sum(f[1] for f in fills),
+            "type": 0,
+            "status": 3,
+            "securityType": 1,
+            "direction": 0,
+            "value": 0.0,
+            "isMarketable": True,
+            "properties": {},
+            "events": events,
+        }
+    )
+
+
+def test_fifo_round_trips_with_partial_close_and_reversal():
+    orders = [
+        _order(1, [(T0, 10, 100.0)]),
+        _order(2, [(T0 + 60, 5, 102.0)]),
+        _order(3, [(T0 + 3600, -18, 110.0)]),
+        _order(4, [(T0 + 7200, 5, 105.0)]),
+    ]
+    trades = reconstruct_trades(orders)
+    assert [(t.quantity, t.entry_price, t.exit_price, t.direction) for t in trades] == [
+        (10, 100.0, 110.0, 0),
+        (5, 102.0, 110.0, 0),
+        (3, 110.0, 105.0, 1),
+    ]
+    assert trades[0].profit_loss == pytest.approx(100.0)
+    assert trades[2].profit_loss == pytest.approx(15.0)
+    assert trades[0].total_fees == pytest.approx(0.1 * 10 + 1.0 / 18 * 10)
+    assert trades[0].duration == "01:00:00"
+
+
+def test_lifo_matches_newest_lot_first():
+    orders = [_order(1, [(T0, 10, 100.0), (T0 + 60, 10, 90.0)]), _order(2, [(T0 + 120, -10, 95.0)])]
+    (trade,) = reconstruct_trades(orders, method="lifo")
+    assert trade.entry_price == 90.0
+    assert trade.profit_loss == pytest.approx(50.0)
+
+
+def test_fractional_fills_close_lots_without_remainders():
+    buys = [_order(i, [(T0 + i, 0.1, 100.0)]) for i in range(3)]
+    orders = [*buys, _order(3, [(T0 + 60, -0.3, 101.0)]), _order(4, [(T0 + 120, 1, 102.0), (T0 + 180, -1, 103.0)])]
+    trades = reconstruct_trades(orders)
+    # no micro-lot is left over from the 0.3 sell to be closed by the next round trip
+    assert [(t.quantity, t.entry_price) for t in trades] == [(0.1, 100.0), (0.1, 100.0), (0.1, 100.0), (1, 102.0)]
+
+
+def test_format_duration():
+    assert format_duration(93_784) == "1.02:03:04"